@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import warnings
-from functools import wraps
 from itertools import product
 from numbers import Integral, Number, Real
-from typing import Optional, Sequence, Union
+from typing import Mapping, NamedTuple, Optional, Sequence, Union
 
 import numpy as np
 
@@ -40,18 +38,72 @@ def find_special_constants(
         return specials
     # check for implicit constants appropriate to the sample type
     implicit_possibilities = IMPLICIT_PDS3_CONSTANTS[obj.dtype.name]
-    # can't check for nans with "in" because it's an equality check, so
-    # we don't intend this to be used, just want to make the key and put
-    # in a value that won't conflict later
-    if np.any(~np.isfinite(obj.data)):
+    scan = scan_array(
+        np.ma.getdata(obj), implicit_possibilities, obj.dtype.kind == "f"
+    )
+    if isinstance(getattr(data, "value_ranges", None), dict):
+        # save the range so that get_scaled() needn't scan the array again
+        data.value_ranges[name] = (scan.low, scan.high)
+    # can't check for nans with equality, so we don't intend this to be
+    # used, just want to make the key and put in a value that won't conflict
+    # later
+    if scan.nonfinite is True:
         specials["INVALIDS"] = np.nan
     return specials | {
         possibility: constant
         for possibility, constant in implicit_possibilities.items()
-        if constant in obj
+        if possibility in scan.present
     }
 
 
+class ArrayScan(NamedTuple):
+    """Results of `scan_array()`."""
+    present: set[str]
+    """names of candidate constants present in the array"""
+    nonfinite: bool
+    """does the array contain NaN or inf?"""
+    low: Optional[Number]
+    """smallest finite value in the array (None if there aren't any)"""
+    high: Optional[Number]
+    """largest finite value in the array (None if there aren't any)"""
+
+
+def scan_array(
+    arr: np.ndarray,
+    candidates: Optional[Mapping[str, Number]] = None,
+    check_nonfinite: bool = False,
+    chunk_elements: Optional[int] = None
+) -> ArrayScan:
+    """
+    In one chunked pass over `arr`, find its range of finite values, which
+    of `candidates` occur in it, and (if `check_nonfinite` is True) whether
+    it contains any NaN or inf values. Candidates outside each chunk's range
+    are skipped without comparison.
+    """
+    chunk_elements = chunk_elements or SCALING_CHUNK_ELEMENTS
+    remaining = {} if candidates is None else dict(candidates)
+    present, nonfinite, low, high = set(), False, None, None
+    flat = arr.reshape(-1)
+    for start in range(0, flat.size, chunk_elements):
+        chunk = flat[start:start + chunk_elements]
+        if check_nonfinite is True:
+            finite = np.isfinite(chunk)
+            if not finite.all():
+                nonfinite, chunk = True, chunk[finite]
+        if chunk.size == 0:
+            continue
+        chunk_low, chunk_high = chunk.min(), chunk.max()
+        low = chunk_low if low is None else min(low, chunk_low)
+        high = chunk_high if high is None else max(high, chunk_high)
+        for name, constant in tuple(remaining.items()):
+            if chunk_low <= constant <= chunk_high and (
+                chunk == constant
+            ).any():
+                present.add(name)
+                remaining.pop(name)
+    return ArrayScan(present, nonfinite, low, high)
+
+
 def mask_specials(obj, specials):
     """"""
     obj = np.ma.masked_array(obj)
@@ -64,71 +116,224 @@ def mask_specials(obj, specials):
     return obj
 
 
-def fit_to_scale(
-    arr: np.ndarray,
+def _scaled_range(
+    low: Number, high: Number, scale: Number, offset: Number
+) -> tuple[Number, Number]:
+    """Range of values between `low` and `high` after scaling."""
+    return tuple(sorted((low * scale + offset, high * scale + offset)))
+
+
+def _dtype_fits(candidate: np.dtype, smin: Number, smax: Number) -> bool:
+    """Can `candidate` hold all values between `smin` and `smax`?"""
+    info = np.finfo(candidate) if candidate.kind == "f" else np.iinfo(candidate)
+    return smin >= info.min and smax <= info.max
+
+
+def smallest_scaled_dtype(
+    dtype: np.dtype,
+    low: Number,
+    high: Number,
     scale: Union[Integral, Real],
     offset: Union[Integral, Real]
-) -> np.ndarray:
+) -> np.dtype:
     """
-    Return a version of `arr` cast to the minimum dtype that will hold its
-    range of values after multiplying by `offset` and adding `scale`.
+    Return the minimum dtype that will hold values of `dtype` between `low`
+    and `high` after multiplying them by `scale` and adding `offset`.
 
     Supports:
 
     float32, float64, uint8, int8, uint16, int16, uint32, int32, uint64, int64.
     """
-    if arr.dtype.char not in 'bBhHiIlLqQnNpPf':
-        raise TypeError(f"This function does not support {arr.dtype.name}")
-    if arr.dtype.char in 'fd' or int(scale + offset) != scale + offset:
-        bases, widths, infofunc = ('f',), (4, 8), np.finfo
+    if dtype.char not in 'bBhHiIlLqQnNpPf':
+        raise TypeError(f"This function does not support {dtype.name}")
+    if dtype.char in 'fd' or int(scale + offset) != scale + offset:
+        bases, widths = ('f',), (4, 8)
     else:
-        bases, widths, infofunc = ('u', 'i'), (1, 2, 4, 8), np.iinfo
-    amin, amax = map(int, (arr.min(), arr.max()))
-    smin, smax = amin * scale + offset, amax * scale + offset
+        bases, widths = ('u', 'i'), (1, 2, 4, 8)
+    smin, smax = _scaled_range(low, high, scale, offset)
     for base, width in product(bases, widths):
         candidate = np.dtype(f'{base}{width}')
-        cinfo = infofunc(candidate)
-        if smin >= cinfo.min and smax <= cinfo.max:
-            return arr.astype(candidate)
+        if _dtype_fits(candidate, smin, smax):
+            return candidate
     raise TypeError("Unable to find a suitable data type for scaling.")
 
 
-def overflow_wrap(array_func):
-    @wraps(array_func)
-    def with_upcasting(arr, scale, offset, *args, **kwargs):
-        with warnings.catch_warnings():
-            warnings.filterwarnings("error", message=".*overflow enc.*")
-            try:
-                return array_func(arr, scale, offset, *args, **kwargs)
-            except (OverflowError, RuntimeWarning):
-                arr = fit_to_scale(arr, scale, offset)
-                return array_func(arr, scale, offset, *args, **kwargs)
+def fit_to_scale(
+    arr: np.ndarray,
+    scale: Union[Integral, Real],
+    offset: Union[Integral, Real]
+) -> np.ndarray:
+    """
+    Return a version of `arr` cast to the minimum dtype that will hold its
+    range of values after multiplying by `scale` and adding `offset`.
+
+    Supports:
 
-    return with_upcasting
+    float32, float64, uint8, int8, uint16, int16, uint32, int32, uint64, int64.
+    """
+    amin, amax = map(int, (arr.min(), arr.max()))
+    return arr.astype(
+        smallest_scaled_dtype(arr.dtype, amin, amax, scale, offset)
+    )
 
 
-def _copy_scale(obj, offset, scale):
+def _integer_scaling_dtype(
+    obj: np.ndarray,
+    scale: Integral,
+    offset: Integral,
+    value_range: Optional[tuple[Optional[Number], Optional[Number]]] = None
+) -> np.dtype:
+    """
+    Pick the dtype for the result of scaling an integer array by integers:
+    its own dtype if that can hold the result, otherwise the smallest one
+    that can. Uses `value_range` if given, and otherwise scans `obj`.
+    """
+    if value_range is None:
+        scan = scan_array(np.ma.getdata(obj))
+        value_range = (scan.low, scan.high)
+    low, high = value_range
+    if low is None:
+        return obj.dtype
+    low, high = int(low), int(high)
+    if _dtype_fits(obj.dtype, *_scaled_range(low, high, scale, offset)):
+        return obj.dtype
+    return smallest_scaled_dtype(obj.dtype, low, high, scale, offset)
+
+
+def _per_band(obj, scale, offset) -> bool:
+    """Do `scale` and `offset` give separate values for each band of `obj`?"""
     try:
-        # TODO: we should also be doing this per-plane scaling in inplace case
-        if len(obj) == len(scale) == len(offset) > 1:
-            planes = [
-                obj[ix] * scale[ix] + offset[ix] for ix in range(len(scale))
-            ]
-            stacked = np.rollaxis(np.ma.dstack(planes), 2)
-            return stacked
+        return len(obj) == len(scale) == len(offset) > 1
     except TypeError:
-        pass  # len() is not usable on a float object
-    return obj * scale + offset
+        return False  # len() is not usable on a float object
+
 
+SCALING_CHUNK_ELEMENTS = 2 ** 16
+"""
+Number of elements `scale_chunked()` processes at once. Small enough that
+each chunk's input, output, and mask stay in cache.
+"""
 
-def _inplace_scale(obj, offset, scale):
-    if len(obj) == len(scale) == len(offset) > 1:
-        for ix, _ in enumerate(scale):
-            obj[ix] = obj[ix] * scale[ix] + offset[ix]
+
+def _scale_band_chunked(
+    src: np.ndarray,
+    dst: np.ndarray,
+    mask: Optional[np.ndarray],
+    scale: Number,
+    offset: Number,
+    specials: Sequence[Number],
+    mask_nonfinite: bool,
+    chunk_elements: int
+):
+    """
+    Helper for `scale_chunked()`. Scale one band (or an entire array) from
+    `src` into `dst`, filling `mask` along the way if it's not None. `src`
+    and `dst` may be the same array.
+    """
+    if not (src.flags.c_contiguous and dst.flags.c_contiguous):
+        # can't take flat views, so just do the whole thing at once
+        src_flat, dst_flat, chunk_elements = src, dst, max(src.size, 1)
+        mask_flat = mask
     else:
-        obj *= scale
-        obj += offset
-    return obj
+        src_flat, dst_flat = src.reshape(-1), dst.reshape(-1)
+        mask_flat = None if mask is None else mask.reshape(-1)
+    for start in range(0, max(src_flat.size, 1), chunk_elements):
+        stop = start + chunk_elements
+        chunk = src_flat if src_flat is src else src_flat[start:stop]
+        out = dst_flat if dst_flat is dst else dst_flat[start:stop]
+        if mask_flat is None:
+            # compute in the output dtype in case it's wider than the input's
+            np.multiply(
+                chunk, scale, out=out, dtype=out.dtype, casting="unsafe"
+            )
+            np.add(out, offset, out=out, dtype=out.dtype, casting="unsafe")
+            continue
+        # compute the mask before an in-place operation clobbers chunk
+        mchunk = mask_flat if mask_flat is mask else mask_flat[start:stop]
+        mchunk[...] = False
+        for special in specials:
+            mchunk |= chunk == special
+        if mask_nonfinite is True:
+            mchunk |= ~np.isfinite(chunk)
+        # as in numpy masked array arithmetic, leave the original values
+        # under the mask
+        keep = ~mchunk
+        np.multiply(
+            chunk,
+            scale,
+            out=out,
+            dtype=out.dtype,
+            casting="unsafe",
+            where=keep
+        )
+        np.add(
+            out, offset, out=out, dtype=out.dtype, casting="unsafe", where=keep
+        )
+        np.copyto(out, chunk, casting="unsafe", where=mchunk)
+
+
+def scale_chunked(
+    obj: np.ndarray,
+    scale: Union[Number, Sequence[Number]],
+    offset: Union[Number, Sequence[Number]],
+    out: np.ndarray,
+    specials: Optional[Sequence[Number]] = None,
+    chunk_elements: int = SCALING_CHUNK_ELEMENTS
+) -> Union[np.ndarray, np.ma.MaskedArray]:
+    """
+    Compute `obj * scale + offset` into the preallocated array `out` (which
+    may be `obj` itself) in chunks of `chunk_elements` elements, masking
+    elements of `obj` equal to any of `specials` in the same pass. If `scale`
+    and `offset` are sequences with one element per band (first axis) of
+    `obj`, apply them per band. Never allocates anything larger than the
+    mask (if any) beyond `out`.
+
+    Returns `out`, or a masked array wrapping `out` if `specials` is not
+    empty. Masked elements hold their original, unscaled values (cast to
+    `out`'s dtype).
+    """
+    specials = [] if specials is None else list(specials)
+    nans = [isinstance(s, Real) and np.isnan(s) for s in specials]
+    mask_nonfinite = any(nans) and obj.dtype.kind == "f"
+    specials = [s for s, is_nan in zip(specials, nans) if not is_nan]
+    mask = None
+    if len(specials) > 0 or mask_nonfinite is True:
+        mask = np.empty(obj.shape, dtype=bool)
+    if _per_band(obj, scale, offset):
+        bands = [
+            (obj[ix], out[ix], None if mask is None else mask[ix], s, o)
+            for ix, (s, o) in enumerate(zip(scale, offset))
+        ]
+    else:
+        bands = [(obj, out, mask, scale, offset)]
+    for src, dst, band_mask, band_scale, band_offset in bands:
+        _scale_band_chunked(
+            src,
+            dst,
+            band_mask,
+            band_scale,
+            band_offset,
+            specials,
+            mask_nonfinite,
+            chunk_elements
+        )
+    if mask is None:
+        return out
+    return np.ma.masked_array(out, mask)
+
+
+def _scaled_dtype(
+    obj: np.ndarray, scale, offset, float_dtype: Optional[np.dtype] = None
+) -> Optional[np.dtype]:
+    """
+    dtype of the result of scaling `obj`, if that result will be floating-
+    point; None if scaling an integer array by integers.
+    """
+    if casting_to_float(obj, scale, offset):
+        return np.dtype(np.float64 if float_dtype is None else float_dtype)
+    if obj.dtype.kind == "f":
+        return obj.dtype
+    return None
 
 
 def scale_array(
@@ -137,8 +342,22 @@ def scale_array(
     object_name: str,
     inplace: bool = False,
     float_dtype: Optional["np.dtype"] = None,
+    specials: Optional[Sequence[Number]] = None,
+    value_range: Optional[tuple[Optional[Number], Optional[Number]]] = None
 ):
-    """"""
+    """
+    Apply the SCALING_FACTOR and OFFSET given in the label to an array,
+    masking any `specials`. Results are computed in cache-sized chunks by
+    `scale_chunked()`, directly into `obj` if `inplace` is True and `obj`
+    already has the result dtype, and otherwise into a single newly-allocated
+    array.
+
+    The result dtype is `float_dtype` (default float64) when scaling an
+    integer array by non-integers, and `obj`'s dtype when scaling a float
+    array. When scaling an integer array by integers, it is the smallest
+    dtype that can hold the results, based on `obj`'s (min, max)
+    `value_range`; we scan `obj` for its range if it's not given.
+    """
     from pdr.formats.checkers import specialblock
 
     block = specialblock(meta, object_name)
@@ -159,20 +378,21 @@ def scale_array(
         if isinstance(offset, str):
             if offset.strip().upper() in {"NULL", "N/A", ""}:
                 offset = 0
+    specials = [] if specials is None else list(specials)
     # meaningfully better for enormous unscaled arrays
     if (scale == 1) and (offset == 0):
-        return obj
-    # try to perform the operation in-place if requested, although if
-    # we're casting to float, we can't
-    # TODO: detect rollover cases, etc.
-    if inplace is True and not casting_to_float(obj, scale, offset):
-        return overflow_wrap(_inplace_scale)(obj, offset, scale)
-    # if we're casting to float, permit specification of dtype
-    # prior to operation (float64 is numpy's default and often excessive)
-    if casting_to_float(obj, scale, offset):
-        if float_dtype is not None:
-            obj = obj.astype(float_dtype)
-    return overflow_wrap(_copy_scale)(obj, offset, scale)
+        return obj if len(specials) == 0 else mask_specials(obj, specials)
+    out_dtype = _scaled_dtype(obj, scale, offset, float_dtype)
+    if out_dtype is None:
+        # integer array scaled by integers. decide up front whether the
+        # results will fit in its dtype, and upcast if they won't.
+        out_dtype = _integer_scaling_dtype(obj, scale, offset, value_range)
+    # we can only work in-place if we're not changing dtype
+    if inplace is True and out_dtype == obj.dtype:
+        out = obj
+    else:
+        out = np.empty(obj.shape, dtype=out_dtype)
+    return scale_chunked(obj, scale, offset, out, specials)
 
 
 # TODO: shake this out much more vigorously
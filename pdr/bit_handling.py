@@ -1,7 +1,6 @@
 """utilities for parsing BIT_COLUMN objects in tables."""
 from __future__ import annotations
-from functools import partial, reduce
-from operator import add
+from functools import partial
 from typing import Any, Mapping, Sequence, TYPE_CHECKING
 
 import numpy as np
@@ -19,21 +18,34 @@ if TYPE_CHECKING:
 
 
 def expand_bit_strings(
-    table: pd.DataFrame, fmtdef: pd.DataFrame
+    table: pd.DataFrame, fmtdef: pd.DataFrame, as_integers: bool = False
 ) -> pd.DataFrame:
     """
     Top-level handler function for the bit column workflow. Converts a binary
     table's bit string columns (if any) from raw bytes to lists of strings
-    (e.g. ['0010, 0011']).
+    (e.g. ['0010, 0011']). If `as_integers` is True, instead replace each bit
+    string column with one unsigned integer column per BIT_COLUMN.
     """
     # bit_handling.get_bit_start_and_size() defines this column, and
     # handlers.add_bit_column_info() adds it.
     if "start_bit_list" not in fmtdef.columns:
         return table
+    if as_integers is True:
+        return split_bit_columns_to_integers(table, fmtdef)
     table = convert_to_full_bit_string(table, fmtdef)
     return splice_bit_string(table, fmtdef)
 
 
+def _bit_string_columns(fmtdef: pd.DataFrame) -> list:
+    """Indices of fmtdef rows that define bit string columns."""
+    # if it's not a list, that means the table column represented by this
+    # fmtdef row isn't a bit string.
+    return [
+        ix for ix in fmtdef.start_bit_list.dropna().index
+        if isinstance(fmtdef.start_bit_list[ix], list)
+    ]
+
+
 def convert_to_full_bit_string(
     table: pd.DataFrame, fmtdef: pd.DataFrame
 ) -> pd.DataFrame:
@@ -41,16 +53,11 @@ def convert_to_full_bit_string(
     Converts the elements of a DataFrame's bit string columns from bytes to
     binary strings (e.g. '00100011').
     """
-    for column in fmtdef.start_bit_list.dropna().index:
-        # if it's not a list, that means the table column represented by this
-        # fmtdef row isn't a bit string.
-        if isinstance(fmtdef.start_bit_list[column], list):
-            byte_column = table[fmtdef.NAME[column]]
-            byte_order = determine_byte_order(fmtdef.DATA_TYPE[column])
-            bit_str_column = convert_byte_column_to_bits(
-                byte_column, byte_order
-            )
-            table[fmtdef.NAME[column]] = bit_str_column
+    for column in _bit_string_columns(fmtdef):
+        byte_column = table[fmtdef.NAME[column]]
+        byte_order = determine_byte_order(fmtdef.DATA_TYPE[column])
+        bit_str_column = convert_byte_column_to_bits(byte_column, byte_order)
+        table[fmtdef.NAME[column]] = bit_str_column
     return table
 
 
@@ -58,10 +65,9 @@ def factor_to_dtype(field_length: int, byte_order: ByteOrder) -> np.dtype:
     """
     Determine the smallest (in terms of length) structured dtype composed of
     unsigned integer dtypes that can parse binary blob of a particular length
-    and byteorder into a list of bytes. Optimizing the dtype length here
-    reduces the number of times we have to call `bin()` in
-    `convert_byte_column_to_bits()`, which is one of the biggest performance
-    bottlenecks in this module.
+    and byteorder into a list of bytes. Bit strings are read as the
+    concatenated binary representations of these integers, so this defines
+    the order of bits within them.
     """
     lengths = [1, 2, 4, 8]
     if field_length in lengths:
@@ -79,33 +85,122 @@ def factor_to_dtype(field_length: int, byte_order: ByteOrder) -> np.dtype:
     return np.dtype(dtype)
 
 
+def _byte_column_to_bit_order(
+    byte_column: pd.Series, byte_order: ByteOrder
+) -> np.ndarray:
+    """
+    Stack the byte strings in a Series into a 2D uint8 array, one row per
+    element, with the bytes of each row rearranged so that reading their bits
+    from most to least significant gives the element's bit string.
+    """
+    width = len(byte_column.iloc[0])
+    # jam the byte strings together and view them as an array
+    raw = np.frombuffer(b"".join(byte_column.tolist()), dtype=np.uint8)
+    raw = raw.reshape(-1, width)
+    if byte_order == ">":
+        return raw
+    # the integers we read little-endian fields as are most significant at
+    # their last byte, so reverse each of them
+    ordered = np.empty_like(raw)
+    dtype = factor_to_dtype(width, byte_order)
+    for name in dtype.names:
+        offset, size = dtype.fields[name][1], dtype[name].itemsize
+        ordered[:, offset:offset + size] = raw[:, offset + size - 1:(
+            None if offset == 0 else offset - 1
+        ):-1]
+    return ordered
+
+
 def convert_byte_column_to_bits(
     byte_column: pd.Series, byte_order: ByteOrder
 ) -> pd.Series:
     """
     Converts byte strings in a Series into binary strings
-    (e.g. b"\x02" -> "10"). All elements of the Series must be byte strings,
-    and all of them must have the same length.
-    """
-    dtype = factor_to_dtype(len(byte_column.iloc[0]), byte_order)
-    # jam the byte strings together and construct an integer ndarray from them
-    byte_array = np.frombuffer(b"".join(byte_column.tolist()), dtype=dtype)
-    bytedf = pd.DataFrame.from_records(byte_array)
-    bit_series = []
-    # noinspection PyTypeChecker
-    for rec_ix in range(len(dtype)):
-        bit_series.append(
-            bytedf[str(rec_ix)]
-            # convert to bin
-            .map(bin)
-            # cut off the '0b'
-            .str.slice(2, None)
-            # make sure they're fixed-length
-            .str.zfill(dtype[rec_ix].itemsize * 8)
+    (e.g. b"\x02" -> "00000010"). All elements of the Series must be byte
+    strings, and all of them must have the same length.
+    """
+    ordered = _byte_column_to_bit_order(byte_column, byte_order)
+    # unpack to 0/1 per bit, then shift to the ASCII codes for '0'/'1'
+    chars = np.unpackbits(ordered, axis=1) + ord("0")
+    strings = chars.view(f"S{chars.shape[1]}").ravel().astype(str)
+    return pd.Series(strings, index=byte_column.index)
+
+
+def _smallest_uint(n_bits: int) -> np.dtype:
+    """Smallest unsigned integer dtype that can hold `n_bits` bits."""
+    for width in (8, 16, 32, 64):
+        if n_bits <= width:
+            return np.dtype(f"u{width // 8}")
+    raise NotImplementedError("Bit fields wider than 64 bits not supported.")
+
+
+def extract_bit_fields(
+    ordered: np.ndarray,
+    start_bit_list: Sequence[int],
+    bit_size_list: Sequence[int]
+) -> list[np.ndarray]:
+    """
+    Extract unsigned integer fields from a 2D uint8 array produced by
+    `_byte_column_to_bit_order()`. `start_bit_list` is 1-indexed from the
+    most significant bit of each row, as in PDS3 BIT_COLUMN definitions.
+    """
+    width = ordered.shape[1]
+    if width <= 8:
+        # pad each row out to 8 bytes and use shift/mask arithmetic
+        padded = np.zeros((len(ordered), 8), dtype=np.uint8)
+        padded[:, 8 - width:] = ordered
+        values = padded.view(">u8").ravel()
+        fields = []
+        for start, size in zip(start_bit_list, bit_size_list):
+            shift = np.uint64(width * 8 - (start - 1) - size)
+            mask = np.uint64((1 << size) - 1)
+            fields.append(
+                ((values >> shift) & mask).astype(_smallest_uint(size))
+            )
+        return fields
+    bits = np.unpackbits(ordered, axis=1)
+    fields = []
+    for start, size in zip(start_bit_list, bit_size_list):
+        dtype = _smallest_uint(size)
+        field = np.zeros(len(ordered), dtype=np.uint64)
+        for bit in range(start - 1, start - 1 + size):
+            field = (field << np.uint64(1)) | bits[:, bit]
+        fields.append(field.astype(dtype))
+    return fields
+
+
+def split_bit_columns_to_integers(
+    table: pd.DataFrame, fmtdef: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Replace each bit string column of a table with one unsigned integer column
+    per BIT_COLUMN, named like "COLUMN_BITCOLUMN".
+    """
+    for column in _bit_string_columns(fmtdef):
+        name = fmtdef.NAME[column]
+        ordered = _byte_column_to_bit_order(
+            table[name], determine_byte_order(fmtdef.DATA_TYPE[column])
+        )
+        fields = extract_bit_fields(
+            ordered,
+            fmtdef.start_bit_list[column],
+            fmtdef.bit_size_list[column]
         )
-    # TODO: should probably be a single pd.concat operation
-    bits = reduce(add, bit_series)
-    return bits
+        if "bit_name_list" in fmtdef.columns and isinstance(
+            fmtdef.bit_name_list[column], list
+        ):
+            bit_names = fmtdef.bit_name_list[column]
+        else:
+            bit_names = list(map(str, range(len(fields))))
+        names = [f"{name}_{bit_name}" for bit_name in bit_names]
+        if len(set(names)) != len(names):
+            names = [f"{n}_{ix}" for ix, n in enumerate(names)]
+        bitdf = pd.DataFrame(dict(zip(names, fields)), index=table.index)
+        loc = table.columns.get_loc(name)
+        table = pd.concat(
+            [table.iloc[:, :loc], bitdf, table.iloc[:, loc + 1:]], axis=1
+        )
+    return table
 
 
 # TODO: this name is kind of misleading -- it does the opposite of splicing
@@ -118,21 +213,20 @@ def splice_bit_string(
     function expects to be called after convert_to_full_bit_string(), because
     the columns must already have been converted into binary strings.
     """
-    for column in fmtdef.start_bit_list.dropna().index:
-        if isinstance(fmtdef.start_bit_list[column], list):
-            bit_column = table[fmtdef.NAME[column]]
-            start_bit_list = [
-                val - 1 for val in fmtdef.start_bit_list[column]
-            ]  # python zero indexing
-            bit_size_list = fmtdef.bit_size_list[column]
-            bit_list_column = bit_column.map(
-                partial(
-                    split_bits,
-                    start_bit_list=start_bit_list,
-                    bit_size_list=bit_size_list,
-                )
+    for column in _bit_string_columns(fmtdef):
+        bit_column = table[fmtdef.NAME[column]]
+        start_bit_list = [
+            val - 1 for val in fmtdef.start_bit_list[column]
+        ]  # python zero indexing
+        bit_size_list = fmtdef.bit_size_list[column]
+        bit_list_column = bit_column.map(
+            partial(
+                split_bits,
+                start_bit_list=start_bit_list,
+                bit_size_list=bit_size_list,
             )
-            table[fmtdef.NAME[column]] = bit_list_column
+        )
+        table[fmtdef.NAME[column]] = bit_list_column
     return table
 
 
@@ -199,6 +293,7 @@ def get_bit_start_and_size(
     """
     start_bit_list = []
     bit_size_list = []
+    bit_name_list = []
     list_of_pvl_objects_for_bit_columns = definition.getall("BIT_COLUMN")
     for pvl_obj in list_of_pvl_objects_for_bit_columns:
         if pvl_obj.get("ITEMS"):
@@ -209,11 +304,13 @@ def get_bit_start_and_size(
                 start_bit = first_item_start_bit + item_index * item_bits
                 start_bit_list.append(start_bit)
                 bit_size_list.append(item_bits)
+                bit_name_list.append(f"{pvl_obj.get('NAME')}_{item_index}")
         else:
             start_bit = pvl_obj.get("START_BIT")
             bit_size = pvl_obj.get("BITS")
             start_bit_list.append(start_bit)
             bit_size_list.append(bit_size)
+            bit_name_list.append(str(pvl_obj.get("NAME")))
     is_also_special, special_start_bit_list = check_special_bit_start_case(
         identifiers, list_of_pvl_objects_for_bit_columns, start_bit_list
     )
@@ -222,5 +319,6 @@ def get_bit_start_and_size(
     else:
         obj["start_bit_list"] = start_bit_list
     obj["bit_size_list"] = bit_size_list
+    obj["bit_name_list"] = bit_name_list
     return obj
 
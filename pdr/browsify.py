@@ -161,6 +161,8 @@ def browsify(obj: Any, outbase: Union[str, Path], **dump_kwargs) -> None:
     for tables, .txt for most other things. if it can't find a reasonable
     translation, it attempts to dump it as .pkl (a serialized binary 'blob').
     """
+    from pdr.pd_utils import LazyTable, WideTable
+
     outbase = str(outbase)
     if isinstance(obj, np.recarray):
         _browsify_recarray(obj, outbase, **dump_kwargs)
@@ -169,7 +171,9 @@ def browsify(obj: Any, outbase: Union[str, Path], **dump_kwargs) -> None:
             pd.DataFrame(obj).to_csv(outbase + ".csv", index=False)
         else:
             _browsify_array(obj, outbase, **dump_kwargs)
-    elif isinstance(obj, pd.DataFrame):
+    elif isinstance(obj, (pd.DataFrame, WideTable, LazyTable)):
+        if isinstance(obj, (WideTable, LazyTable)):
+            obj = obj.to_dataframe()
         if len(obj) == 1:
             # noinspection PyTypeChecker
             obj.T.to_csv(outbase + ".csv"),
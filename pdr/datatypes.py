@@ -6,7 +6,7 @@ from __future__ import annotations
 from itertools import product
 import re
 from types import MappingProxyType
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from pdr.utils import read_hex
 
@@ -46,6 +46,22 @@ def determine_byte_order(sample_type: str) -> ByteOrder:
     return ">"
 
 
+def vax_real_format(sample_type: str, sample_bytes: int) -> Optional[str]:
+    """
+    Identify the VAX floating-point format ('F', 'D', or 'G') of a PDS3 VAX
+    real data type with the given byte width. Returns None for data types
+    that are not VAX reals.
+    """
+    sample_type = sample_type.replace(" ", "_")
+    if sample_type == "VAXG_REAL":
+        return "G"
+    if sample_type == "VAX_DOUBLE":
+        return "D"
+    if sample_type == "VAX_REAL":
+        return "F" if sample_bytes == 4 else "D"
+    return None
+
+
 def sample_types(
     sample_type: str, sample_bytes: int, for_numpy: bool = False
 ) -> str:
@@ -74,9 +90,9 @@ def sample_types(
         )
     else:
         _float = ""
-    if sample_type == "VAX_REAL" and sample_bytes != 4:
+    if sample_type in ("VAX_DOUBLE", "VAXG_REAL") and sample_bytes != 8:
         raise NotImplementedError(
-            "VAX reals that are not 4 bytes wide are not supported."
+            f"{sample_bytes}-byte {sample_type} values are not supported."
         )
     # noinspection PyUnboundLocalVariable
     return {
@@ -107,7 +123,11 @@ def sample_types(
         # apart from byte width and order, but it shouldn't be a float type in
         # case of platform-specific differences, numpy being excessively
         # clever, etc.
+        # VAX_REAL is F-floating if 4 bytes wide, D-floating if 8; VAX_DOUBLE
+        # is always D-floating and VAXG_REAL G-floating
         "VAX_REAL": f"<u{sample_bytes}",
+        "VAX_DOUBLE": f"<u{sample_bytes}",
+        "VAXG_REAL": f"<u{sample_bytes}",
         "IBM_REAL": f">u{sample_bytes}",
         "EBCDIC": f"V{sample_bytes}",
         "EBCDIC_CHARACTER": f"V{sample_bytes}",
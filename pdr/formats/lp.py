@@ -13,15 +13,13 @@ def ancillary_table_loader(fn, fmtdef_dt):
         * eng_ancillary
     """
     from pdr.utils import decompress
-    from io import StringIO
     from pdr.loaders.table import _read_fwf_with_colspecs
 
     with decompress(fn) as f:
-        stringbuf = StringIO(f.read().decode())
-    stringbuf.seek(0)
+        buffer = f.read()
 
     fmtdef, dt = fmtdef_dt
-    table = _read_fwf_with_colspecs(fmtdef, stringbuf)
+    table = _read_fwf_with_colspecs(fmtdef, buffer)
 
     table = table.iloc[:, 0:6]
     table.columns = [
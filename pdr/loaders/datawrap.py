@@ -119,6 +119,25 @@ class ReadTable(Loader):
         }
 
 
+class IterTable(Loader):
+    """
+    wrapper for iter_binary_table. uses the same queries as ReadTable, but
+    returns a generator of DataFrame chunks rather than a loaded table.
+    """
+
+    def __init__(self):
+        from pdr.loaders.queries import table_position, parse_table_structure
+        from pdr.loaders.table import iter_binary_table
+
+        super().__init__(iter_binary_table)
+        self.queries = DEFAULT_DATA_QUERIES | {
+            "table_props": specialize(table_position, check_special_position),
+            "fmtdef_dt": specialize(
+                parse_table_structure, check_special_structure
+            ),
+        }
+
+
 class ReadHeader(Loader):
     """wrapper for read_header"""
 
@@ -7,10 +7,9 @@ from typing import Optional
 import warnings
 
 import numpy as np
-import vax
 
 from pdr.loaders.queries import get_image_properties
-from pdr.np_utils import make_c_contiguous, np_from_buffered_io
+from pdr.np_utils import make_c_contiguous, np_from_buffered_io, vax_to_np
 from pdr.pdrtypes import ImageProps, DataIdentifiers
 from pdr.utils import decompress
 
@@ -74,9 +73,12 @@ def extract_single_band_linefix(
 
 
 def convert_if_vax(image: np.ndarray, props: dict) -> np.ndarray:
-    """If an array is in 32-bit VAX real format, convert it to 32-bit float."""
+    """
+    If an array is in VAX real format, convert it to float: 32-bit for VAX
+    F-floating, 64-bit for VAX D- and G-floating.
+    """
     if props.get('is_vax_real') is True:
-        return vax.from_vax32(image)
+        return vax_to_np(image, props["vax_format"])
     return image
 
 
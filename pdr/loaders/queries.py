@@ -18,7 +18,7 @@ import warnings
 
 from multidict import MultiDict
 
-from pdr.datatypes import sample_types
+from pdr.datatypes import sample_types, vax_real_format
 from pdr.formats import check_special_block, check_special_offset
 from pdr.func import specialize
 from pdr.loaders._helpers import (
@@ -52,7 +52,10 @@ def generic_qube_properties(
     props["sample_type"] = sample_types(
         use_block["CORE_ITEM_TYPE"], props["BYTES_PER_PIXEL"]
     )
-    props["is_vax_real"] = use_block["CORE_ITEM_TYPE"] == "VAX_REAL"
+    props["vax_format"] = vax_real_format(
+        use_block["CORE_ITEM_TYPE"], props["BYTES_PER_PIXEL"]
+    )
+    props["is_vax_real"] = props["vax_format"] is not None
     if "AXIS_NAME" in set(block.keys()).union(use_block.keys()):
         props['axnames'] = block.get("AXIS_NAME")
         if props['axnames'] is None:
@@ -221,11 +224,16 @@ def generic_image_properties(block: MultiDict, sample_type: str) -> ImageProps:
     Construct a dict of image properties later used in the image-loading
     workflow.
     """
+    # TODO: BYTES_PER_PIXEL check appears repeated with slight variation
+    #  from base_sample_info()
+    bytes_per_pixel = int(block["SAMPLE_BITS"] / 8)
+    vax_format = vax_real_format(
+        block.get("SAMPLE_TYPE", ""), bytes_per_pixel
+    )
     props = {
-        # TODO: BYTES_PER_PIXEL check appears repeated with slight variation
-        #  from base_sample_info()
-        "BYTES_PER_PIXEL": int(block["SAMPLE_BITS"] / 8),
-        "is_vax_real": block.get("SAMPLE_TYPE") == "VAX_REAL",
+        "BYTES_PER_PIXEL": bytes_per_pixel,
+        "is_vax_real": vax_format is not None,
+        "vax_format": vax_format,
         "sample_type": sample_type,
         "nrows": block["LINES"],
         "ncols": block["LINE_SAMPLES"],
@@ -463,6 +471,24 @@ def _table_row_position(
     return n_records, start
 
 
+def _table_record_length(block, identifiers) -> Optional[int]:
+    """
+    Get the length in bytes of each record of a table with fixed-length
+    records, if we can.
+    """
+    try:
+        if "RECORD_BYTES" in block.keys():
+            return block["RECORD_BYTES"]
+        if "ROW_BYTES" in block.keys():
+            return block["ROW_BYTES"] + block.get("ROW_SUFFIX_BYTES", 0)
+        # TODO, probably, and applicable many more places than here:
+        #  ideally we don't use identifiers for anything but special
+        #  case checks.
+        return identifiers["RECORD_BYTES"]
+    except AttributeError:
+        return None
+
+
 def _table_length(block, identifiers, n_records):
     """"""
     length = None
@@ -470,18 +496,7 @@ def _table_length(block, identifiers, n_records):
         if "BYTES" in block.keys():
             length = block["BYTES"]
         elif n_records is not None:
-            if "RECORD_BYTES" in block.keys():
-                record_length = block["RECORD_BYTES"]
-            elif "ROW_BYTES" in block.keys():
-                record_length = block["ROW_BYTES"]
-                record_length += block.get("ROW_SUFFIX_BYTES", 0)
-            elif identifiers["RECORD_BYTES"] is not None:
-                # TODO, probably, and applicable many more places than here:
-                #  ideally we don't use identifiers for anything but special
-                #  case checks.
-                record_length = identifiers["RECORD_BYTES"]
-            else:
-                record_length = None
+            record_length = _table_record_length(block, identifiers)
             if record_length is not None:
                 length = record_length * n_records
     except AttributeError:
@@ -505,6 +520,8 @@ def table_position(
     "start" and "length" should be interpreted as rows; otherwise, both "start"
     and "length" should be interpreted as bytes. If length is None, the table
     occupies the entirety of the file including and after "start".
+    "record_length" is the length of each row in bytes, if known; it is
+    always None if as_rows is True.
     """
     if start_byte < 0:
         raise ValueError(f"bad start byte {start_byte}")
@@ -512,14 +529,21 @@ def table_position(
         n_records = _extract_table_records(block)
     except AttributeError:
         n_records = None
+    record_length = None
     if (as_rows := _check_delimiter_stream(identifiers, name, target, block)):
         length, start = _table_row_position(n_records, target)
     else:
         start = start_byte
         length = _table_length(block, identifiers, n_records)
+        record_length = _table_record_length(block, identifiers)
     if length in (None, "UNK") and "HEADER" in name:
         raise NotImplementedError("header with unknown length")
-    return {"start": start, "length": length, "as_rows": as_rows}
+    return {
+        "start": start,
+        "length": length,
+        "as_rows": as_rows,
+        "record_length": record_length
+    }
 
 
 def get_return_default(data: PDRLike, name: str) -> MultiDict:
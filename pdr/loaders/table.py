@@ -3,8 +3,12 @@ Functions for the nitty-gritty byte-juggling parts of
 TABLE/SPREADSHEET/ARRAY/HISTOGRAM loading.
 """
 from __future__ import annotations
-from io import StringIO
-from typing import Optional, TYPE_CHECKING
+from hashlib import md5
+from io import BytesIO
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator, Optional, Sequence, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -16,12 +20,12 @@ from pdr import bit_handling
 from pdr.datatypes import sample_types
 from pdr.loaders._helpers import check_explicit_delimiter
 from pdr.loaders.queries import get_array_num_items
-from pdr.np_utils import np_from_buffered_io, enforce_order_and_object
+from pdr.np_utils import np_from_buffered_io
 from pdr.pd_utils import (
-    booleanize_booleans, compute_offsets, convert_ebcdic, convert_ibm_reals,
-    convert_vax_reals
+    columns_from_plan, compile_column_plan, compute_offsets,
+    scale_table_columns, wide_table_from_records, WideTable
 )
-from pdr.utils import decompress, head_file
+from pdr.utils import decompress
 
 if TYPE_CHECKING:
     from pdr.pdrtypes import DataIdentifiers
@@ -33,6 +37,44 @@ Characters we want to strip from the beginning/end of every element of an
 ASCII table.
 """
 
+ASCII_NA_VALUES = (
+    b"", b"#N/A", b"#N/A N/A", b"#NA", b"-1.#IND", b"-1.#QNAN", b"-NaN",
+    b"-nan", b"1.#IND", b"1.#QNAN", b"<NA>", b"N/A", b"NA", b"NULL", b"NaN",
+    b"None", b"n/a", b"nan", b"null"
+)
+"""
+Strings pandas' text parsers treat as null by default. The vectorized
+fixed-width parser treats them the same way.
+"""
+
+ASCII_TRUE_VALUES = (b"True", b"TRUE", b"true")
+ASCII_FALSE_VALUES = (b"False", b"FALSE", b"false")
+"""
+Strings pandas' text parsers treat as booleans by default. The vectorized
+fixed-width parser treats them the same way.
+"""
+
+FWF_SNIFF_BYTES = 1024 ** 2
+"""How far into an ASCII table we look for its first line terminator."""
+
+WIDE_TABLE_MIN_COLUMNS = 10000
+"""
+Single-row binary tables with at least this many columns are loaded as
+WideTables by default.
+"""
+
+DEFAULT_CHUNK_ROWS = 100000
+"""Default number of rows per chunk for `iter_binary_table()`."""
+
+NEWLINE_CHUNK_BYTES = 16 * 1024 ** 2
+"""Chunk size for counting lines in a delimited ASCII table."""
+
+TRAILING_FILL_BYTES = (0, 10, 13, 26, 32)
+"""
+Bytes we ignore if they are all that follows the last full record of a
+fixed-width table (nulls, line terminators, DOS EOF, spaces).
+"""
+
 
 def read_array(fn, block, start_byte, fmtdef_dt):
     """
@@ -77,73 +119,263 @@ def read_table(
     table_props,
     block,
     start_byte,
+    bits_as_integers: Optional[bool] = False,
+    wide_table: Optional[bool] = None,
+    columns: Optional[Sequence[str]] = None,
+    rows: Optional[slice] = None,
 ):
     """
     Read a table. Parse the label format definition and then decide whether to
     treat the table as text or binary.
+
+    These options can be passed as keyword arguments to `Data.load()`:
+
+    * If `bits_as_integers` is True, split BIT_COLUMNs of binary tables into
+      unsigned integer columns rather than lists of binary strings.
+    * If `wide_table` is True, load a binary table as a `WideTable` rather than
+      a DataFrame; if False, never do that. By default, we do it only for
+      single-row tables with at least WIDE_TABLE_MIN_COLUMNS columns.
+    * If `columns` is specified, load only those columns. Binary tables are
+      read with a reduced dtype that skips unwanted fields; fixed-width ASCII
+      tables parse only the selected fields. Columns of array fields and
+      integer BIT_COLUMNs are named like "FIELD_0" and "FIELD_BITNAME".
+    * If `rows` is a slice, load only those rows. Binary tables and ASCII
+      tables with fixed-length records seek straight to the first selected
+      row; other ASCII tables skip lines without parsing them. The returned
+      table's index gives the selected rows' positions in the full table.
     """
     fmtdef, dt = fmtdef_dt
+    row_range = None
+    if rows is not None:
+        n_rows = block.get("ROWS")
+        if dt is not None and n_rows is None:
+            n_rows = 1
+        row_range = _row_range(rows, n_rows)
     if dt is None:  # we believe object is an ascii file
+        usecols = None
+        if columns is not None:
+            usecols = _projected_fields(fmtdef["NAME"], columns)
         table = _interpret_as_ascii(
-            fn, fmtdef, block, table_props
+            fn, fmtdef, block, table_props, identifiers, usecols, row_range
         )
-        if len(table.columns) != len(fmtdef):
-            table.columns = [
-                f for f in fmtdef['NAME'] if not f.startswith('PLACEHOLDER')
-        ]
-        else:
-            table.columns = fmtdef['NAME']
+        if row_range is not None and row_range[2] != 1:
+            table = table.iloc[::row_range[2]]
     else:
-        table = _interpret_as_binary(fn, fmtdef, dt, block, start_byte)
+        if columns is not None:
+            fmtdef, dt = _project_binary_structure(fmtdef, dt, columns)
+        table = _interpret_as_binary(
+            fn,
+            fmtdef,
+            dt,
+            block,
+            start_byte,
+            bits_as_integers,
+            wide_table,
+            row_range
+        )
+        if isinstance(table, WideTable):
+            return table
+    if row_range is not None:
+        start, _, step = row_range
+        table.index = pd.RangeIndex(start, start + len(table) * step, step)
     table = _drop_placeholders(table)
-    # If there is an offset and/or scaling factor, apply them:
-    if fmtdef.get("OFFSET") is not None or fmtdef.get("SCALING_FACTOR") is not None:
-        for col in table.columns:
-            record = fmtdef.loc[fmtdef['NAME'] == col].to_dict("records")[0]
-            if record.get("SCALING_FACTOR") and not pd.isnull(record.get("SCALING_FACTOR")):
-                table[col] = table[col].mul(record["SCALING_FACTOR"])
-            else:
-                scaling_factor = 1  # TODO: appears superfluous
-            if record.get("OFFSET") and not pd.isnull(record.get("OFFSET")):
-                offset = record["OFFSET"]
-                table[col] = table[col]+offset
+    if dt is None:
+        # binary tables are scaled as they're read
+        table = scale_table_columns(table, fmtdef)
+    if columns is not None:
+        table = table[list(columns)]
     return table
 
 
-def _interpret_as_binary(fn, fmtdef, dt, block, start_byte):
+def _row_range(
+    rows: slice, n_rows: Optional[int]
+) -> tuple[int, Optional[int], int]:
+    """
+    Convert a slice to concrete (start, stop, step) row numbers for a table
+    with `n_rows` rows. If `n_rows` is None (unknown), `stop` may be None,
+    meaning "to the end of the table", and negative indices are not allowed.
+    """
+    if not isinstance(rows, slice):
+        raise TypeError("rows must be a slice")
+    if rows.step is not None and rows.step < 1:
+        raise ValueError("rows must have a positive step")
+    if n_rows is not None:
+        return rows.indices(n_rows)
+    if any(i is not None and i < 0 for i in (rows.start, rows.stop)):
+        raise ValueError(
+            "Negative row indices require a known number of rows"
+        )
+    return rows.start or 0, rows.stop, rows.step or 1
+
+
+def _projected_fields(
+    names: Sequence[str], columns: Sequence[str]
+) -> list[str]:
+    """
+    Select the fields of a table that we need to read in order to produce
+    `columns`. Array fields and integer BIT_COLUMNs produce columns named
+    like "FIELD_0" or "FIELD_BITNAME", so those also match by prefix.
+    """
+    fields, missing = [], set(columns)
+    for name in names:
+        if "PLACEHOLDER" in name:
+            continue
+        matched = {c for c in columns if c == name or c.startswith(f"{name}_")}
+        if len(matched) > 0:
+            fields.append(name)
+            missing.difference_update(matched)
+    if len(missing) > 0:
+        raise KeyError(f"Columns not found in table: {sorted(missing)}")
+    return fields
+
+
+def _project_binary_structure(
+    fmtdef: pd.DataFrame, dt: np.dtype, columns: Sequence[str]
+) -> tuple[pd.DataFrame, np.dtype]:
+    """
+    Reduce a binary table's format definition and structured dtype to the
+    fields needed to produce `columns`. The reduced dtype keeps the original
+    field offsets and record length, so numpy simply skips everything else.
+    """
+    fields = _projected_fields(dt.names, columns)
+    reduced = np.dtype(
+        {
+            "names": fields,
+            "formats": [dt.fields[f][0] for f in fields],
+            "offsets": [dt.fields[f][1] for f in fields],
+            "itemsize": dt.itemsize,
+        }
+    )
+    return fmtdef.loc[fmtdef["NAME"].isin(fields)], reduced
+
+
+def _use_wide_table(
+    wide_table: Optional[bool],
+    fmtdef: pd.DataFrame,
+    dt: np.dtype,
+    count: int
+) -> bool:
+    """
+    Should we load this binary table as a WideTable? Tables with BIT_COLUMNs
+    are always loaded as DataFrames.
+    """
+    if wide_table is False or "start_bit_list" in fmtdef.columns:
+        return False
+    if wide_table is True:
+        return True
+    return count == 1 and len(dt.names) >= WIDE_TABLE_MIN_COLUMNS
+
+
+def _interpret_as_binary(
+    fn,
+    fmtdef,
+    dt,
+    block,
+    start_byte,
+    bits_as_integers=False,
+    wide_table=None,
+    row_range=None
+):
     """"""
-    # TODO: this works poorly (from a usability and performance
-    #  perspective; it's perfectly stable) for tables defined as
-    #  a single row with tens or hundreds of thousands of columns
     count = block.get("ROWS")
     # TODO: what is this a fallback for? it could produce incorrect
     #  behavior in some cases
     count = count if count is not None else 1
+    plan = compile_column_plan(fmtdef, dt)
+    use_wide = _use_wide_table(wide_table, fmtdef, dt, count)
+    step = 1
+    if row_range is not None:
+        start, stop, step = row_range
+        start_byte += start * dt.itemsize
+        count = max(stop - start, 0)
+    if use_wide:
+        # structured dtypes and DataFrames with tens of thousands of fields
+        # perform very poorly, so read raw records and slice them up into
+        # homogeneous blocks instead
+        with decompress(fn) as f:
+            records = np_from_buffered_io(
+                f,
+                dtype=np.dtype((np.void, dt.itemsize)),
+                offset=start_byte,
+                count=count
+            )
+        records = records.view(np.uint8).reshape(-1, dt.itemsize)
+        return wide_table_from_records(records[::step], dt, plan)
     with decompress(fn) as f:
-        table = np_from_buffered_io(
+        array = np_from_buffered_io(
             f, dtype=dt, offset=start_byte, count=count
         )
-    table = enforce_order_and_object(table)
-    table = pd.DataFrame(table)
-    table = convert_ibm_reals(table, fmtdef)
-    table = convert_vax_reals(table, fmtdef)
-    table.columns = fmtdef.NAME.tolist()
-    table = convert_ebcdic(table, fmtdef)
-    table = booleanize_booleans(table, fmtdef)
-    table = bit_handling.expand_bit_strings(table, fmtdef)
-    return table
+    return _records_to_table(array[::step], fmtdef, plan, bits_as_integers)
+
+
+def _records_to_table(
+    array: np.ndarray,
+    fmtdef: pd.DataFrame,
+    plan: tuple,
+    bits_as_integers: bool = False
+) -> pd.DataFrame:
+    """
+    Convert a structured array of binary table records to a DataFrame,
+    performing all type conversions, scaling, and bit column handling.
+    """
+    table = columns_from_plan(array, plan)
+    return bit_handling.expand_bit_strings(table, fmtdef, bits_as_integers)
+
+
+def iter_binary_table(
+    fn,
+    fmtdef_dt,
+    block,
+    start_byte,
+    chunk_rows: Optional[int] = DEFAULT_CHUNK_ROWS,
+    columns: Optional[Sequence[str]] = None,
+    bits_as_integers: Optional[bool] = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a binary table `chunk_rows` rows at a time, yielding each chunk as a
+    DataFrame processed exactly as `read_table()` would process the whole
+    table. If `columns` is not None, yield only those columns. The file is
+    not opened until iteration begins.
+    """
+    fmtdef, dt = fmtdef_dt
+    if dt is None:
+        raise NotImplementedError(
+            "chunked reading is only supported for binary tables"
+        )
+    if columns is not None:
+        fmtdef, dt = _project_binary_structure(fmtdef, dt, columns)
+    if chunk_rows is None or chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer")
+    count = block.get("ROWS")
+    count = count if count is not None else 1
+    plan = compile_column_plan(fmtdef, dt)
+    with decompress(fn) as f:
+        f.seek(start_byte)
+        for chunk_start in range(0, count, chunk_rows):
+            array = np_from_buffered_io(
+                f, dtype=dt, count=min(chunk_rows, count - chunk_start)
+            )
+            if len(array) == 0:
+                # file is shorter than the label claims
+                return
+            table = _records_to_table(array, fmtdef, plan, bits_as_integers)
+            table.index += chunk_start
+            if columns is not None:
+                table = table[list(columns)]
+            yield table
 
 
 def _read_as_delimited(
     sep: str,
-    string_buffer: StringIO,
+    buffer: bytes,
     fmtdef: pd.DataFrame
 ) -> Optional[pd.DataFrame]:
     """
     Attempt to read an ASCII table as a delimiter-separated file. We always
     try this first before moving to a fixed-width parser.
     """
-    table = pd.read_csv(string_buffer, sep=sep, header=None)
+    # NOTE: BytesIO shares the memory of a bytes object it's initialized with
+    table = pd.read_csv(BytesIO(buffer), sep=sep, header=None)
     # TODO: adding this 'PLACEHOLDER' check has allowed many tables to use
     #  read_csv() instead of read_fwf(), which is generally preferable
     #  because read_fwf() is very slow. This may also be able to invalidate
@@ -158,35 +390,126 @@ def _read_as_delimited(
     return table
 
 
-def read_strictly_fixed(string_buffer, specs, padchars=PAD_CHARACTERS):
-    from collections import defaultdict
-    from more_itertools import windowed
-    startwidth = specs[0][1] - specs[0][0]
-    midwidths = {i0 + 1: b - a for i0, (a, b) in enumerate(specs[1:-1])}
-    lastwidth = specs[-1][1] - specs[-1][0]
-    skips = {
-        i1: (c - b) for i1, ((_a, b), (c, _d)) in enumerate(windowed(specs, 2))
-    }
-    cols = defaultdict(list)
-    while True:
-        firstfield = string_buffer.read(startwidth)
-        if firstfield == '':
-            break
-        cols[0].append(firstfield.strip(padchars))
-        string_buffer.read(skips[0])
-        for i0, width in midwidths.items():
-            cols[i0].append(string_buffer.read(width).strip(padchars))
-            string_buffer.read(skips[i0])
-        cols[len(specs)].append(string_buffer.read(lastwidth).strip(padchars))
-    return pd.DataFrame(cols)
+def _name_ascii_columns(
+    table: pd.DataFrame, fmtdef: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Assign names from a format definition to the columns of a parsed ASCII
+    table. Some parsers skip PLACEHOLDER fields and some don't.
+    """
+    if len(table.columns) != len(fmtdef):
+        table.columns = [
+            f for f in fmtdef['NAME'] if not f.startswith('PLACEHOLDER')
+        ]
+    else:
+        table.columns = fmtdef['NAME']
+    return table
 
 
-def _read_fwf_with_colspecs(
-    fmtdef: pd.DataFrame, string_buffer: StringIO
-) -> pd.DataFrame:
+def _fixed_width_records(buffer: bytes) -> Optional[np.ndarray]:
     """
-    Attempt to read an ASCII table as a fixed-width file using column
-    boundaries specified by or inferred from its format definition.
+    View an ASCII buffer as a 2D (rows, record length) uint8 array if every
+    record in it has the same length and ends with a line terminator. Return
+    None if it doesn't look like that.
+    """
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    if raw.size == 0 or raw.max() > 127:
+        # byte offsets are only guaranteed to match character offsets in
+        # pure ASCII
+        return None
+    newlines = np.flatnonzero(raw[:FWF_SNIFF_BYTES] == 10)
+    reclen = raw.size if len(newlines) == 0 else int(newlines[0]) + 1
+    n_full, remainder = divmod(raw.size, reclen)
+    unterminated = False
+    if remainder > 0:
+        tail = raw[n_full * reclen:]
+        if np.isin(tail, TRAILING_FILL_BYTES).all():
+            raw = raw[:n_full * reclen]
+        else:
+            # assume the final record is simply missing its line terminator
+            raw = np.concatenate(
+                [raw, np.full(reclen - remainder, 32, dtype=np.uint8)]
+            )
+            unterminated = True
+    records = raw.reshape(-1, reclen)
+    check = records[:-1] if unterminated else records
+    if len(newlines) > 0 and not (check[:, -1] == 10).all():
+        return None
+    return records
+
+
+def _convert_fixed_width_field(field: np.ndarray) -> np.ndarray:
+    """
+    Convert a stripped 'S'-dtype column the way pd.read_fwf() infers its
+    type: to int64 if possible, float64 if possible (with NaN for null
+    fields), bool if every non-null field is a boolean string (object, with
+    NaN for null fields, if any are null), and otherwise to strings.
+    """
+    nulls = np.isin(field, ASCII_NA_VALUES)
+    if nulls.all():
+        return np.full(field.shape, np.nan)
+    present = field[~nulls] if nulls.any() else field
+    for dtype in (np.int64, np.float64):
+        try:
+            converted = present.astype(dtype)
+        except (ValueError, OverflowError):
+            continue
+        if present is field:
+            return converted
+        out = np.full(field.shape, np.nan)
+        out[~nulls] = converted
+        return out
+    true = np.isin(present, ASCII_TRUE_VALUES)
+    if (true | np.isin(present, ASCII_FALSE_VALUES)).all():
+        if present is field:
+            return true
+        out = np.full(field.shape, np.nan, dtype=object)
+        out[~nulls] = true.astype(object)
+        return out
+    out = np.char.decode(field).astype(object)
+    out[nulls] = np.nan
+    return out
+
+
+def read_fixed_width_records(
+    buffer: bytes,
+    colspecs: Sequence[tuple[int, int]],
+    padchars: str = PAD_CHARACTERS
+) -> Optional[pd.DataFrame]:
+    """
+    Vectorized fixed-width ASCII table parser. Views `buffer` as an array of
+    equal-length records and slices each column out of every row at once,
+    then performs type conversion on entire columns. Returns None if `buffer`
+    does not have a regular record layout, in which case the caller should
+    fall back to a more forgiving parser. Like pd.read_fwf(), skips blank
+    records (records containing only padding and line terminators).
+    """
+    records = _fixed_width_records(buffer)
+    if records is None:
+        return None
+    strip = (padchars + "\r\n").encode()
+    blank_bytes = np.frombuffer(strip, dtype=np.uint8)
+    # only records that start with padding can be blank
+    maybe_blank = np.flatnonzero(np.isin(records[:, 0], blank_bytes))
+    if len(maybe_blank) > 0:
+        blank = np.isin(records[maybe_blank], blank_bytes).all(axis=1)
+        records = np.delete(records, maybe_blank[blank], axis=0)
+    reclen, columns = records.shape[1], {}
+    for ix, (start, stop) in enumerate(colspecs):
+        start, stop = int(start), min(int(stop), reclen)
+        if start >= stop:
+            columns[ix] = np.full(len(records), np.nan)
+            continue
+        field = np.ascontiguousarray(records[:, start:stop])
+        field = np.char.strip(field.view(f"S{stop - start}").ravel(), strip)
+        columns[ix] = _convert_fixed_width_field(field)
+    return pd.DataFrame(columns)
+
+
+def _fmtdef_colspecs(fmtdef: pd.DataFrame) -> list[tuple[int, int]]:
+    """
+    Compute (start, stop) character positions for each field of an ASCII
+    table from its format definition.
     """
     colspecs = []
     # TODO: this if clause is a 'general special' statement, intended to handle
@@ -205,12 +528,26 @@ def _read_fwf_with_colspecs(
         colspecs.append(
             (record["SB_OFFSET"], record["SB_OFFSET"] + col_length)
         )
+    return colspecs
+
+
+def _read_fwf_with_colspecs(
+    fmtdef: pd.DataFrame, buffer: bytes
+) -> pd.DataFrame:
+    """
+    Attempt to read an ASCII table as a fixed-width file using column
+    boundaries specified by or inferred from its format definition. Use the
+    vectorized parser if the table has a regular record layout; otherwise,
+    fall back to pd.read_fwf().
+    """
+    colspecs = _fmtdef_colspecs(fmtdef)
+    if (table := read_fixed_width_records(buffer, colspecs)) is not None:
+        return table
     # NOTE: the 'delimiter' argument to read_fwf() does _not_ specify
     # an actual delimiter. It defines characters the read_fwf parser
     # will treat as 'padding' and strip from each table element.
-    # return read_strictly_fixed(string_buffer, colspecs, PAD_CHARACTERS)
     table = pd.read_fwf(
-        string_buffer,
+        BytesIO(buffer),
         header=None,
         colspecs=colspecs,
         delimiter=PAD_CHARACTERS
@@ -218,56 +555,264 @@ def _read_fwf_with_colspecs(
     return table
 
 
-def _read_table_from_stringio(
+def _parse_delimited(
     fmtdef: pd.DataFrame,
     block: MultiDict,
-    string_buffer: StringIO
+    buffer: bytes,
+    _usecols: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    ASCII table parsing strategy: delimiter-separated values. Always parses
+    every column, because we check the column count against `fmtdef`.
+    """
+    sep = check_explicit_delimiter(block)
+    return _name_ascii_columns(_read_as_delimited(sep, buffer, fmtdef), fmtdef)
+
+
+def _parse_fixed_width(
+    fmtdef: pd.DataFrame,
+    _block: MultiDict,
+    buffer: bytes,
+    usecols: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    ASCII table parsing strategy: fixed-width with known colspecs. If
+    `usecols` is specified, parse only those fields.
+    """
+    if "BYTES" not in fmtdef.columns:
+        raise ParserError("Format definition does not give column widths.")
+    if usecols is not None:
+        fmtdef = fmtdef.loc[fmtdef["NAME"].isin(usecols)]
+    return _name_ascii_columns(_read_fwf_with_colspecs(fmtdef, buffer), fmtdef)
+
+
+def _parse_fwf_inferred(
+    fmtdef: pd.DataFrame,
+    _block: MultiDict,
+    buffer: bytes,
+    _usecols: Optional[Sequence[str]] = None
 ) -> pd.DataFrame:
     """
-    Attempt to parse a string buffer, presumably containing an ASCII table, as
+    ASCII table parsing strategy: last-ditch fallback if we don't have column
+    specifications or using the column specifications didn't work. This
+    usually won't work!
+    """
+    # NOTE: see note in _read_fwf_with_colspecs() on 'delimiter' argument
+    table = pd.read_fwf(BytesIO(buffer), header=None, delimiter=PAD_CHARACTERS)
+    return _name_ascii_columns(table, fmtdef)
+
+
+ASCII_TABLE_STRATEGIES = MappingProxyType(
+    {
+        "delimited": (
+            _parse_delimited,
+            (IndexError, UnicodeError, AttributeError, ParserError)
+        ),
+        "fixed_width": (
+            _parse_fixed_width, (pd.errors.EmptyDataError, ParserError)
+        ),
+        "fwf_inferred": (_parse_fwf_inferred, ()),
+    }
+)
+"""
+ASCII table parsing strategies in the order we try them, along with the
+exceptions that mean 'move on to the next one'.
+"""
+
+ASCII_PARSER_CACHE: dict[str, str] = {}
+"""
+Names of the ASCII_TABLE_STRATEGIES that succeeded for previously-loaded
+tables, keyed by a fingerprint of their layout and product type. Persist it
+between sessions with save_ascii_parser_cache() / load_ascii_parser_cache().
+"""
+
+CACHEABLE_ASCII_STRATEGIES = ("delimited",)
+"""
+ASCII_TABLE_STRATEGIES whose success we record in ASCII_PARSER_CACHE. The
+fixed-width parsers almost never fail, so jumping straight to one of them
+would silently misparse a delimited table that shares a fingerprint with a
+fixed-width one.
+"""
+
+
+def ascii_layout_fingerprint(
+    identifiers: Optional[DataIdentifiers],
+    fmtdef: pd.DataFrame,
+    block: MultiDict
+) -> str:
+    """
+    Compute a key for ASCII_PARSER_CACHE from a table's product type and
+    format definition.
+    """
+    fields = [
+        c for c in ("NAME", "DATA_TYPE", "BYTES", "SB_OFFSET", "ITEM_BYTES")
+        if c in fmtdef.columns
+    ]
+    identifiers = {} if identifiers is None else identifiers
+    key = (
+        identifiers.get("DATA_SET_ID"),
+        identifiers.get("PRODUCT_TYPE"),
+        block.get("FIELD_DELIMITER"),
+        fields,
+        fmtdef[fields].to_numpy().tolist(),
+    )
+    return md5(repr(key).encode()).hexdigest()
+
+
+def save_ascii_parser_cache(path: Union[str, Path]):
+    """Write ASCII_PARSER_CACHE to a JSON file."""
+    with open(path, "w") as stream:
+        json.dump(ASCII_PARSER_CACHE, stream)
+
+
+def load_ascii_parser_cache(path: Union[str, Path]):
+    """
+    Update ASCII_PARSER_CACHE from a JSON file written by
+    save_ascii_parser_cache().
+    """
+    with open(path) as stream:
+        cached = json.load(stream)
+    ASCII_PARSER_CACHE.update(
+        {k: v for k, v in cached.items() if v in CACHEABLE_ASCII_STRATEGIES}
+    )
+
+
+def _read_table_from_buffer(
+    fmtdef: pd.DataFrame,
+    block: MultiDict,
+    buffer: bytes,
+    fingerprint: Optional[str] = None,
+    usecols: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Attempt to parse a bytes buffer, presumably containing an ASCII table, as
     a pandas DataFrame. First try to treat it as a delimiter-separated table;
-    fall back to fixed-width parsing if that doesn't work.
+    fall back to fixed-width parsing if that doesn't work. The parsers decode
+    the buffer themselves, so we never hold a decoded copy of the whole table.
+
+    If `fingerprint` is given and a delimited parse last worked for that
+    fingerprint, go straight to it, and record whether it works this time. If
+    `usecols` is given, return only those columns (some strategies can skip
+    parsing the others).
     """
     # TODO, maybe: add better delimiter detection & dispatch
-    try:
-        sep = check_explicit_delimiter(block)
-        return _read_as_delimited(sep, string_buffer, fmtdef)
-    except (IndexError, UnicodeError, AttributeError, ParserError):
-        string_buffer.seek(0)
-    if "BYTES" in fmtdef.columns:
+    strategies = list(ASCII_TABLE_STRATEGIES)
+    if (cached := ASCII_PARSER_CACHE.get(fingerprint)) is not None:
+        parser, expected = ASCII_TABLE_STRATEGIES[cached]
         try:
-            return _read_fwf_with_colspecs(fmtdef, string_buffer)
-        except (pd.errors.EmptyDataError, pd.errors.ParserError):
-            string_buffer.seek(0)
-    # last-ditch fallback if we don't have column specifications or using the
-    # column specifications didn't work. This usually won't work!
-    # NOTE: see note in _read_fwf_with_colspecs() on 'delimiter' argument
-    return pd.read_fwf(string_buffer, header=None, delimiter=PAD_CHARACTERS)
+            table = parser(fmtdef, block, buffer, usecols)
+            return table if usecols is None else table[list(usecols)]
+        except expected:
+            # the layout matched, but this table is different somehow
+            strategies.remove(cached)
+            ASCII_PARSER_CACHE.pop(fingerprint)
+    for ix, name in enumerate(strategies):
+        parser, expected = ASCII_TABLE_STRATEGIES[name]
+        try:
+            table = parser(fmtdef, block, buffer, usecols)
+        except expected:
+            if ix == len(strategies) - 1:
+                raise
+            continue
+        if fingerprint is not None and name in CACHEABLE_ASCII_STRATEGIES:
+            ASCII_PARSER_CACHE[fingerprint] = name
+        return table if usecols is None else table[list(usecols)]
+
+
+def _newline_offset(buffer: bytes, n_lines: int) -> int:
+    """
+    Return the offset of the byte just after the `n_lines`th newline in
+    `buffer`, or the length of `buffer` if it contains fewer newlines than
+    that. Counts newlines in fixed-size chunks to bound memory use.
+    """
+    if n_lines <= 0:
+        return 0
+    raw, seen = np.frombuffer(buffer, dtype=np.uint8), 0
+    for chunk_start in range(0, raw.size, NEWLINE_CHUNK_BYTES):
+        chunk = raw[chunk_start:chunk_start + NEWLINE_CHUNK_BYTES]
+        hits = np.flatnonzero(chunk == 10)
+        if seen + len(hits) >= n_lines:
+            return chunk_start + int(hits[n_lines - seen - 1]) + 1
+        seen += len(hits)
+    return raw.size
+
+
+def _seek_ascii_rows(
+    f, table_props: dict, start: int, stop: Optional[int]
+) -> Optional[bytes]:
+    """
+    Read rows `start` through `stop` of an ASCII table with fixed-length
+    records by seeking straight to them. Return None if the table doesn't
+    have fixed-length records, or if they don't look like we expect them to.
+    """
+    record_length = table_props.get("record_length")
+    if table_props["as_rows"] is True or not record_length:
+        return None
+    table_end = None
+    if table_props["length"] not in (None, "", "UNK"):
+        table_end = table_props["start"] + table_props["length"]
+    first = table_props["start"] + start * record_length
+    end = None if stop is None else first + (stop - start) * record_length
+    if table_end is not None:
+        end = table_end if end is None else min(end, table_end)
+    f.seek(first)
+    buffer = f.read() if end is None else f.read(max(end - first, 0))
+    if len(buffer) >= record_length and buffer[record_length - 1] != 10:
+        # records aren't newline-terminated where we think they should be
+        return None
+    return buffer
+
+
+def _read_ascii_bytes(
+    fn: str,
+    table_props: dict,
+    row_range: Optional[tuple[int, Optional[int], int]] = None
+) -> bytes:
+    """
+    Read the raw bytes of an ASCII table from a file without decoding them or
+    splitting them into lines. If `row_range` is specified, read only the
+    rows from its start to its stop (ignoring its step).
+    """
+    with decompress(fn) as f:
+        if row_range is not None:
+            buffer = _seek_ascii_rows(f, table_props, *row_range[:2])
+            if buffer is not None:
+                return buffer
+        if table_props["as_rows"] is False:
+            f.seek(table_props["start"])
+            buffer = f.read(table_props["length"])
+        else:
+            for _ in range(table_props["start"]):
+                f.readline()
+            buffer = f.read()
+            if table_props["length"] not in (None, ""):
+                end = _newline_offset(buffer, table_props["length"])
+                # avoid copying the buffer if the table runs to the end of
+                # the file
+                buffer = buffer if end == len(buffer) else buffer[:end]
+    if row_range is None:
+        return buffer
+    start, stop = row_range[:2]
+    end = len(buffer) if stop is None else _newline_offset(buffer, stop)
+    return buffer[_newline_offset(buffer, start):end]
 
 
 def _interpret_as_ascii(
     fn: str,
     fmtdef: pd.DataFrame,
     block: MultiDict,
-    table_props: dict
+    table_props: dict,
+    identifiers: Optional[DataIdentifiers] = None,
+    usecols: Optional[Sequence[str]] = None,
+    row_range: Optional[tuple[int, Optional[int], int]] = None
 ):
-    """Load text from a file and parse it as an ASCII table."""
-    with decompress(fn) as f:
-        if table_props["as_rows"] is False:
-            bytesbuf = head_file(
-                f, nbytes=table_props["length"], offset=table_props["start"]
-            )
-            try:
-                stringbuf = StringIO(bytesbuf.read().decode())
-            finally:
-                bytesbuf.close()
-        else:
-            if table_props["start"] > 0:
-                [next(f) for _ in range(table_props["start"])]
-            if table_props["length"] in (None, ""):
-                lines = f.readlines()
-            else:
-                lines = [next(f) for _ in range(table_props["length"])]
-            stringbuf = StringIO("\r\n".join(map(bytes.decode, lines)))
-    stringbuf.seek(0)
-    return _read_table_from_stringio(fmtdef, block, stringbuf)
+    """
+    Load bytes from a file and parse them as an ASCII table with named
+    columns, optionally only the fields named in `usecols` and the rows in
+    `row_range` (see `_read_ascii_bytes()`).
+    """
+    buffer = _read_ascii_bytes(fn, table_props, row_range)
+    fingerprint = ascii_layout_fingerprint(identifiers, fmtdef, block)
+    return _read_table_from_buffer(
+        fmtdef, block, buffer, fingerprint, usecols
+    )
@@ -4,15 +4,14 @@ pdr.Metadata constructor.
 """
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import Mapping, TYPE_CHECKING
+from typing import Mapping, TYPE_CHECKING, Union
 
-from dustgoggles.func import constant
-from dustgoggles.structures import dig_for_keys
 from multidict import MultiDict
 
 
 if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element
+
     from pdr.pds4_tools.reader.label_objects import Label
 
 
@@ -46,7 +45,52 @@ def unpack_to_multidict(
     return unpacked
 
 
-# noinspection PyTypeChecker
+def _prefix_tag(tag: str, namespaces: list[tuple[str, str]]) -> str:
+    """replace the '{uri}' of a namespaced tag with its 'prefix:'."""
+    for uri, prefix in namespaces:
+        tag = tag.replace(uri, prefix)
+    return tag
+
+
+def _unpack_element(
+    element: "Element",
+    namespaces: list[tuple[str, str]],
+    tags: dict[str, str]
+) -> tuple[Union[MultiDict, str, None], list[str]]:
+    """
+    Recursively unpack an XML element into the value it would have in
+    `unpack_to_multidict(label.to_dict())`, along with the keys
+    `dig_for_keys()` would find in that value. `tags` caches the prefixed
+    form of each raw (namespaced) element tag.
+    """
+    children, text = list(element), element.text
+    has_text = text is not None and bool(text.strip())
+    if not children:
+        if has_text:
+            return text, []
+        return (MultiDict() if element.attrib else None), []
+    # like pds4_tools' xml_to_dict, group repeated child elements together
+    # at the position of their first occurrence
+    grouped = {}
+    for child in children:
+        grouped.setdefault(child.tag, []).append(child)
+    unpacked, keys, nested_keys = MultiDict(), [], []
+    for tag, elements in grouped.items():
+        key = tags.get(tag)
+        if key is None:
+            key = tags[tag] = _prefix_tag(tag, namespaces)
+        for child in elements:
+            value, child_keys = _unpack_element(child, namespaces, tags)
+            unpacked.add(key, value)
+            keys.append(key)
+            if isinstance(value, MultiDict):
+                nested_keys += child_keys
+    if has_text:
+        unpacked.add("_text", text)
+        keys.append("_text")
+    return unpacked, keys + nested_keys
+
+
 def reformat_pds4_tools_label(label: "Label") -> tuple[MultiDict, list[str]]:
     """
     Convert a pds4_tools Label object into a MultiDict and a list of parameters
@@ -54,10 +98,21 @@ def reformat_pds4_tools_label(label: "Label") -> tuple[MultiDict, list[str]]:
     conversion; it also rearranges some nested data structures (in particular,
     repeated child elements become multiple keys of a MultiDict rather than
     a list of OrderedDicts).
+
+    Produces exactly what `unpack_to_multidict(label.to_dict())` and
+    `dig_for_keys()` over the result would, but in a single walk of the
+    label's already-parsed XML tree.
     """
-    unpacked = unpack_to_multidict(label.to_dict(), (OrderedDict, MultiDict))
+    root = label.getroot()
+    namespaces = [
+        ("{" + uri + "}", prefix + ":" if prefix.strip() else "")
+        for uri, prefix in label.get_namespace_map().items()
+    ]
+    root_tag = _prefix_tag(root.tag, namespaces)
+    value, keys = _unpack_element(root, namespaces, {})
+    unpacked = MultiDict([(root_tag, value)])
     # collect all keys to populate pdr.Metadata's fieldcounts attribute
-    params = dig_for_keys(
-        unpacked, None, base_pred=constant(True), mtypes=(MultiDict,)
-    )
+    params = [root_tag]
+    if isinstance(value, MultiDict):
+        params += keys
     return unpacked, params
@@ -3,25 +3,34 @@ Methods for working with pandas objects, primarily intended for use in
 TABLE/ARRAY/SPREADSHEET/HISTOGRAM-loading workflows.
 """
 from __future__ import annotations
+from functools import lru_cache
 from itertools import chain
+from numbers import Number
 import re
-from typing import Hashable, TYPE_CHECKING
+from typing import (
+    Any, Callable, Hashable, Sequence, TYPE_CHECKING, Union
+)
 import warnings
 
 from more_itertools import divide
 import numpy as np
 import pandas as pd
 import pandas.api.types
-import vax
 
 from pdr.datatypes import sample_types
 from pdr.formats import check_special_sample_type
 from pdr.np_utils import (
-    enforce_order_and_object, ibm32_to_np_f32, ibm64_to_np_f64
+    enforce_order_and_object,
+    enforce_order_and_object_columns,
+    enforce_order_and_object_field,
+    ibm32_to_np_f32,
+    ibm64_to_np_f64,
+    vax_to_np,
 )
 
 if TYPE_CHECKING:
     from pdr.pdrtypes import DataIdentifiers
+    from pdr.pds4_tools.reader.table_objects import TableStructure
 
 
 def numeric_columns(df: pd.DataFrame) -> list[Hashable]:
@@ -251,21 +260,32 @@ def booleanize_booleans(
     return table
 
 
-def convert_ebcdic(
-    table: pd.DataFrame, fmtdef: pd.DataFrame
-) -> pd.DataFrame:
+# Unicode code point of each EBCDIC (code page 500) byte value. cp500 maps
+# onto exactly the Latin-1 repertoire, so all of them fit in one UCS4 unit.
+EBCDIC_CODEPOINTS = np.array(
+    [ord(c) for c in bytes(range(256)).decode("cp500")], dtype=np.uint32
+)
+
+
+def decode_ebcdic(values: np.ndarray) -> pd.Series:
     """
-    Decode any columns of a DataFrame that contain bytestrings constructed from
-    IBM S/360-style EBCDIC-encoded text to Python strings.
+    Decode an array of fixed-width EBCDIC-encoded bytestrings (void or bytes
+    dtype) to a Series of Python strings. Rather than decoding each element
+    separately, translate the whole block of bytes to code points with a
+    lookup table and reinterpret it as a numpy unicode array. Values of other
+    dtypes are decoded element by element.
     """
-    ebcdic_columns = fmtdef.loc[
-        fmtdef["DATA_TYPE"].str.contains("EBCDIC"), "NAME"
-    ]
-    for col in ebcdic_columns:
-        # TODO: why do we copy table[col] twice?
-        series = pd.Series(table[col])
-        table[col] = series.str.decode('cp500')
-    return table
+    values = np.asarray(values)
+    if values.dtype.kind not in "SV" or values.ndim != 1:
+        return pd.Series(values.astype("O")).str.decode("cp500")
+    width = values.dtype.itemsize
+    raw = np.ascontiguousarray(values).view(np.uint8).reshape(-1, width)
+    if values.dtype.kind == "V" and (raw[:, -1] == 0).any():
+        # numpy unicode arrays would drop the trailing NULs that decoding
+        # each void element keeps
+        return pd.Series(values.astype("O")).str.decode("cp500")
+    codepoints = np.take(EBCDIC_CODEPOINTS, raw)
+    return pd.Series(codepoints.view(f"U{width}").ravel())
 
 
 def rectified_rec_df(array: np.ndarray) -> pd.DataFrame:
@@ -285,8 +305,30 @@ def rectified_rec_df(array: np.ndarray) -> pd.DataFrame:
         # if it doesn't have a structured dtype, don't call from_records --
         # it's slow and acts weird
         return pd.DataFrame(enforce_order_and_object(array))
-    # but if it does, do
-    return pd.DataFrame.from_records(enforce_order_and_object(array))
+    # if it does, swap and convert it column-wise rather than casting
+    # whole records
+    return pd.DataFrame(
+        {
+            name: _pandas_column(column)
+            for name, column in enforce_order_and_object_columns(
+                array
+            ).items()
+        },
+        copy=False,
+    )
+
+
+def _pandas_column(column: np.ndarray) -> np.ndarray:
+    """
+    Make a 1D field of a structured array into a contiguous array pandas can
+    use directly: swap it to native byte order and convert bytes and void
+    dtypes to object. Native-order fields that are already contiguous are not
+    copied.
+    """
+    column = np.asarray(column)
+    if column.dtype.kind == "S":
+        return column.astype("O")
+    return np.ascontiguousarray(enforce_order_and_object_field(column))
 
 
 def structured_array_to_df(array: np.ndarray) -> pd.DataFrame:
@@ -296,6 +338,42 @@ def structured_array_to_df(array: np.ndarray) -> pd.DataFrame:
     typecasting as necessary for pandas compatibility. This does not attempt
     to flatten nested elements with dimensionality > 2, and will raise a
     NotImplementedError if it encounters them.
+
+    Columns are assembled as a dict of contiguous 1D arrays and the
+    DataFrame is constructed from them once, without copying them again.
+    """
+    columns = {}
+    for name in array.dtype.names:
+        field = array[name]
+        if field.ndim == 1:
+            columns[name] = _pandas_column(field)
+            continue
+        if field.ndim > 3:
+            raise NotImplementedError(
+                "dtypes with >2D elements are not supported"
+            )
+        field = field.reshape(field.shape[0], -1)
+        if isinstance(field, np.ma.MaskedArray) and field.mask.any():
+            # pandas fills (and upcasts) masked nested arrays as a block
+            block = rectified_rec_df(field)
+            for ix in range(field.shape[1]):
+                columns[f"{name}_{ix}"] = block[ix].to_numpy()
+            continue
+        for ix in range(field.shape[1]):
+            columns[f"{name}_{ix}"] = _pandas_column(field[:, ix])
+    if len(columns) == sum(
+        int(np.prod(array.dtype[name].shape)) for name in array.dtype.names
+    ):
+        return pd.DataFrame(columns, copy=False)
+    # column names collide (e.g. a field 'X_0' and a nested array 'X')
+    return _concat_structured_array_to_df(array)
+
+
+def _concat_structured_array_to_df(array: np.ndarray) -> pd.DataFrame:
+    """
+    Convert a structured array to a DataFrame one block of columns at a
+    time. Slower than `structured_array_to_df()`, but allows duplicate
+    column names.
     """
     sub_dfs = []
     name_buffer = []
@@ -318,51 +396,500 @@ def structured_array_to_df(array: np.ndarray) -> pd.DataFrame:
     return pd.concat(sub_dfs, axis=1)
 
 
-def convert_ibm_reals(df: pd.DataFrame, fmtdef: pd.DataFrame) -> pd.DataFrame:
+def pds4_structured_array_to_df(array: np.ndarray) -> pd.DataFrame:
     """
-    Converts all IBM reals in a dataframe from packed 32- or 64-bit integer
-    form to np.float32 or np.float64.
+    Convert the structured array of a pds4_tools TableStructure to a
+    DataFrame, removing pds4_tools' group names from its column names.
     """
-    if not fmtdef['DATA_TYPE'].str.contains('IBM').any():
-        return df
-    reals = {}
-    for _, field in fmtdef.iterrows():
-        if not re.match(r'IBM.*REAL', field['DATA_TYPE']):
-            continue
-        func = ibm32_to_np_f32 if field['BYTES'] == 4 else ibm64_to_np_f64
-        converted = func(df[field['NAME']].values)
-        if field['BYTES'] == 4:
-            # IBM shorts are wider-range than IEEE shorts; check if we can
-            # safely cast them back down to float32
-            absolute = abs(converted)
-            big = absolute.max() > np.finfo(np.float32).max
-            nonzero = absolute[absolute > 0]
-            if len(nonzero) > 0:
-                small = nonzero.min() < 1e-44
-            else:
-                small = False
-            if not (big or small):
-                converted = converted.astype(np.float32)
-        reals[field['NAME']] = converted
+    df = structured_array_to_df(array)
+    df.columns = df.columns.str.replace(r"GROUP_?\d+", "", regex=True)
+    df.columns = df.columns.str.strip(", ")
+    return df
+
+
+class LazyTable:
+    """
+    Table whose columns are read only when they are first accessed. Columns
+    are read in units of 'fields' (for instance, all repetitions of a PDS4
+    group field make up one field). `read_fields(fields)` must return a
+    DataFrame containing every column of the requested fields, in table
+    order. Column names may repeat, as they can in a DataFrame.
+    `to_dataframe()` reads all fields that have not been read yet.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[tuple[Hashable, Sequence[str]]],
+        read_fields: Callable[[list[Hashable]], pd.DataFrame],
+        n_rows: int
+    ):
+        self.fields = list(fields)
+        self.read_fields = read_fields
+        self.n_rows = n_rows
+        self._columns: list[str] = []
+        # column positions of each field and of each column name
+        self._field_positions: dict[Hashable, list[int]] = {}
+        self._name_positions: dict[str, list[int]] = {}
+        for field, names in self.fields:
+            for name in names:
+                position = len(self._columns)
+                self._columns.append(name)
+                self._field_positions.setdefault(field, []).append(position)
+                self._name_positions.setdefault(name, []).append(position)
+        self._field_order = {
+            field: ix for ix, (field, _) in enumerate(self.fields)
+        }
+        self._loaded: dict[int, pd.Series] = {}
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of all columns, in order."""
+        return list(self._columns)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(rows, columns), as for a DataFrame."""
+        return self.n_rows, len(self._columns)
+
+    def _load(self, fields: list[Hashable]):
+        if len(fields) == 0:
+            return
+        fields = sorted(fields, key=self._field_order.__getitem__)
+        positions = list(
+            chain.from_iterable(self._field_positions[f] for f in fields)
+        )
+        table = self.read_fields(fields)
+        if len(table.columns) != len(positions):
+            raise ValueError(
+                f"Expected {len(positions)} columns for fields {fields}, "
+                f"got {len(table.columns)}."
+            )
+        for ix, position in enumerate(positions):
+            self._loaded[position] = table.iloc[:, ix]
+
+    def _load_positions(self, positions: Sequence[int]):
+        """Read every unread field that has a column at one of `positions`."""
+        unread = [p for p in positions if p not in self._loaded]
+        fields = [
+            field for field, field_positions in self._field_positions.items()
+            if not set(field_positions).isdisjoint(unread)
+        ]
+        self._load(fields)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Read any unread fields and construct a DataFrame of the table."""
+        self._load_positions(range(len(self._columns)))
+        table = pd.DataFrame(
+            {ix: self._loaded[ix] for ix in range(len(self._columns))}
+        )
+        table.columns = self._columns
+        return table
+
+    def __getitem__(self, name: str) -> Union[pd.Series, pd.DataFrame]:
+        positions = self._name_positions[name]
+        self._load_positions(positions)
+        if len(positions) == 1:
+            return self._loaded[positions[0]]
+        # a repeated name selects all of its columns, as in a DataFrame
+        table = pd.DataFrame({ix: self._loaded[ix] for ix in positions})
+        table.columns = [name] * len(positions)
+        return table
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._name_positions
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyTable({self.n_rows} rows x {len(self._columns)} columns, "
+            f"{len(self._loaded)} read)"
+        )
+
+
+def pds4_lazy_table(structure: "TableStructure") -> LazyTable:
+    """
+    Construct a LazyTable for a pds4_tools TableStructure, reading and
+    converting only the PDS4 fields whose columns are accessed.
+    """
+    from pdr.pds4_tools.reader.data_types import pds_to_numpy_name
+    from pdr.pds4_tools.reader.read_tables import (
+        _read_table_byte_data,
+        read_table_fields,
+    )
+    from pdr.pds4_tools.reader.table_objects import TableManifest
+
+    # list fields in the order read_table_fields() returns them:
+    # Uniformly_Sampled fields first, then all other fields in label order
+    manifest = TableManifest.from_label(structure.label)
+    fields = []
+    for field in chain(
+        manifest.uniformly_sampled_fields(),
+        manifest.fields(skip_uniformly_sampled=True),
+    ):
+        name, shape = pds_to_numpy_name(field.full_name()), field.shape[1:]
+        if len(shape) == 0:
+            names = [name]
+        else:
+            names = [f"{name}_{ix}" for ix in range(int(np.prod(shape)))]
+        names = [
+            re.sub(r"GROUP_?\d+", "", n).strip(", ") for n in names
+        ]
+        fields.append((name, names))
+
+    # the table's byte data, read from disk on the first column access and
+    # shared by all later ones
+    byte_data = []
+
+    def read_fields(field_names: list[str]) -> pd.DataFrame:
+        if len(byte_data) == 0:
+            byte_data.append(_read_table_byte_data(structure))
+        array = read_table_fields(
+            structure,
+            field_names,
+            no_scale=structure._no_scale,
+            decode_strings=structure._decode_strings,
+            masked=structure._masked,
+            max_workers=structure._max_workers,
+            table_byte_data=byte_data[0],
+        )
+        return pds4_structured_array_to_df(array)
+
+    return LazyTable(fields, read_fields, structure.meta_data["records"])
+
+
+def _ibm_column_to_float(values: np.ndarray, n_bytes: int) -> np.ndarray:
+    """
+    Convert a column of IBM reals from packed 32- or 64-bit integer form to
+    np.float32 or np.float64.
+    """
+    if n_bytes != 4:
         # IBM longs just get more precise, not wider-ranged, so we don't need
         # to check for longlong or anything like that
-    for k, v in reals.items():
-        df[k] = v
-    return df
+        return ibm64_to_np_f64(values)
+    # IBM shorts are wider-range than IEEE shorts. convert straight to
+    # float32, then check if any values were out of its range (or too
+    # small to represent precisely) -- only values that came out at float32's
+    # limits can be, so we only need to convert those at double precision.
+    with np.errstate(over="ignore"):
+        converted = ibm32_to_np_f32(values, np.float32)
+    absolute = np.abs(converted)
+    limits = (absolute >= np.finfo(np.float32).max) | (absolute < 2e-44)
+    if limits.any():
+        exact = np.abs(ibm32_to_np_f32(values[limits]))
+        big = exact.max() > np.finfo(np.float32).max
+        nonzero = exact[exact > 0]
+        if len(nonzero) > 0:
+            small = nonzero.min() < 1e-44
+        else:
+            small = False
+        if big or small:
+            return ibm32_to_np_f32(values)
+    return converted
+
+
+def _vax_format(kind: str, n_bytes: int) -> str:
+    """
+    Identify the VAX floating-point format ('F', 'D', or 'G') of a column
+    with the given conversion kind and byte width.
+    """
+    if kind == "vaxg":
+        return "G"
+    return "F" if n_bytes == 4 else "D"
 
 
-def convert_vax_reals(data: pd.DataFrame, properties: pd.DataFrame) -> pd.DataFrame:
-    """If any columns in a DataFrame are in 32-bit VAX real format,
-    convert them to 32-bit float."""
-    if not properties['DATA_TYPE'].str.contains('VAX').any():
-        return data
-    reals = {}
-    for _, field in properties.iterrows():
-        if not re.match(r'VAX.*REAL', field['DATA_TYPE']):
+def _column_conversion_kind(data_type: str) -> str:
+    """
+    Classify a PDS3 DATA_TYPE by the post-load conversion its column needs.
+    """
+    if re.match(r"IBM.*REAL", data_type):
+        return "ibm"
+    if re.match(r"VAXG.*REAL", data_type):
+        return "vaxg"
+    if re.match(r"VAX.*REAL", data_type) or data_type == "VAX_DOUBLE":
+        return "vax"
+    if "EBCDIC" in data_type:
+        return "ebcdic"
+    if data_type == "BOOLEAN":
+        return "bool"
+    return "plain"
+
+
+def _scaling_value(value: Any, default: Number) -> Number:
+    """
+    Interpret a SCALING_FACTOR or OFFSET from a column definition, returning
+    `default` if it's absent, null, or zero.
+    """
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(value, str) or value is None or pd.isnull(value):
+        return default
+    return value if value else default
+
+
+def column_scaling(fmtdef: pd.DataFrame) -> dict[str, tuple[Number, Number]]:
+    """
+    Map the names of all columns of a table that have a nontrivial
+    SCALING_FACTOR and/or OFFSET to (scale, offset) pairs.
+    """
+    if fmtdef.get("OFFSET") is None and fmtdef.get("SCALING_FACTOR") is None:
+        return {}
+    scales = fmtdef.get("SCALING_FACTOR", pd.Series(None, index=fmtdef.index))
+    offsets = fmtdef.get("OFFSET", pd.Series(None, index=fmtdef.index))
+    scaling = {}
+    for name, scale, offset in zip(fmtdef["NAME"], scales, offsets):
+        scale, offset = _scaling_value(scale, 1), _scaling_value(offset, 0)
+        if (scale, offset) != (1, 0):
+            scaling[name] = (scale, offset)
+    return scaling
+
+
+@lru_cache(maxsize=256)
+def _compile_column_plan(
+    dt: np.dtype, specs: tuple[tuple[str, str, Number, Number], ...]
+) -> tuple[tuple[str, str, Number, Number], ...]:
+    """Inner, memoized, hashable-argument version of compile_column_plan()."""
+    specs = {spec[0]: spec for spec in specs}
+    plan = []
+    for name in dt.names:
+        if "PLACEHOLDER" in name:
+            continue
+        _, data_type, scale, offset = specs.get(name, (name, "", 1, 0))
+        plan.append((name, _column_conversion_kind(data_type), scale, offset))
+    return tuple(plan)
+
+
+def compile_column_plan(
+    fmtdef: pd.DataFrame, dt: np.dtype
+) -> tuple[tuple[str, str, Number, Number], ...]:
+    """
+    Construct a 'plan' for converting a binary table, read as an ndarray with
+    structured dtype `dt`, into a DataFrame: a sequence of (field name,
+    conversion kind, scale, offset) tuples, omitting placeholder fields. Plans
+    are memoized, so products that share a format definition only compute
+    this once.
+    """
+    scaling = column_scaling(fmtdef)
+    specs = tuple(
+        (name, data_type, *scaling.get(name, (1, 0)))
+        for name, data_type in zip(fmtdef["NAME"], fmtdef["DATA_TYPE"])
+    )
+    return _compile_column_plan(dt, specs)
+
+
+def _scale_column(values, scale: Number, offset: Number):
+    """
+    Apply a column's scale and offset, in place if it's already a float
+    array that we own.
+    """
+    if (scale, offset) == (1, 0):
+        return values
+    if (
+        isinstance(values, np.ndarray)
+        and values.dtype.kind == "f"
+        and values.flags.writeable
+    ):
+        values *= scale
+        values += offset
+        return values
+    return values * scale + offset
+
+
+def scale_table_columns(
+    table: pd.DataFrame, fmtdef: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Apply column SCALING_FACTORs and OFFSETs from a format definition to a
+    table all at once.
+    """
+    scaling = column_scaling(fmtdef)
+    targets = [c for c in table.columns if c in scaling]
+    if len(targets) == 0:
+        return table
+    scales = pd.Series({c: scaling[c][0] for c in targets})
+    offsets = pd.Series({c: scaling[c][1] for c in targets})
+    table[targets] = table[targets].mul(scales).add(offsets)
+    return table
+
+
+def _convert_column(field: np.ndarray, kind: str):
+    """
+    Convert a single (1D) field of a structured array as specified by a
+    column plan. Always returns an array or Series in native byteorder that
+    does not share memory with the structured array.
+    """
+    if kind == "ibm":
+        return _ibm_column_to_float(field, field.dtype.itemsize)
+    if kind in ("vax", "vaxg"):
+        return vax_to_np(field, _vax_format(kind, field.dtype.itemsize))
+    if kind == "ebcdic":
+        return decode_ebcdic(field)
+    if kind == "bool":
+        return field.astype(bool)
+    if field.dtype.kind == "V":
+        return field.astype("O")
+    if not field.dtype.isnative:
+        # swaps and copies in one pass
+        return field.astype(field.dtype.newbyteorder("="))
+    # not ascontiguousarray(): that returns `field` itself if it is already
+    # contiguous (e.g. the only field of its records), and _scale_column()
+    # would then scale the caller's array in place
+    return np.array(field, copy=True)
+
+
+def columns_from_plan(
+    array: np.ndarray, plan: tuple[tuple[str, str], ...]
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from an ndarray with a structured dtype by converting
+    it one field at a time as specified by `plan` (see
+    `compile_column_plan()`). This performs byteswapping, IBM/VAX real
+    conversion, EBCDIC decoding, boolean casting, and scaling in a single
+    pass, making only one copy of each column. Fields containing 1- or 2-D arrays become
+    blocks of columns named like "FIELD_0", "FIELD_1", etc.
+    """
+    columns = {}
+    for name, kind, scale, offset in plan:
+        field = array[name]
+        if field.dtype.names is not None:
+            raise NotImplementedError(
+                "nested structured fields in binary tables are not supported"
+            )
+        if field.ndim == 1:
+            columns[name] = _scale_column(
+                _convert_column(field, kind), scale, offset
+            )
+            continue
+        field = field.reshape(len(field), -1)
+        for ix in range(field.shape[1]):
+            columns[f"{name}_{ix}"] = _scale_column(
+                _convert_column(field[:, ix], kind), scale, offset
+            )
+    return pd.DataFrame(columns, copy=False)
+
+
+class WideTable:
+    """
+    Compact representation of a binary table with a very large number of
+    columns (typically a single row with tens or hundreds of thousands of
+    them). Each run of adjacent, identically-typed columns is stored as one
+    2D (rows x columns) ndarray. Individual columns are available as views
+    via `table[name]`; `to_dataframe()` builds a DataFrame only on request.
+    """
+
+    def __init__(self, blocks: Sequence[tuple[Sequence[str], np.ndarray]]):
+        self.blocks = list(blocks)
+        self._locations = {}
+        for block_ix, (names, _) in enumerate(self.blocks):
+            for col_ix, name in enumerate(names):
+                self._locations[name] = (block_ix, col_ix)
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of all columns, in order."""
+        return list(self._locations.keys())
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(rows, columns), as for a DataFrame."""
+        return len(self), len(self._locations)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Construct a DataFrame with the same contents as this table."""
+        columns = {}
+        for names, block in self.blocks:
+            for col_ix, name in enumerate(names):
+                columns[name] = block[:, col_ix]
+        return pd.DataFrame(columns)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        block_ix, col_ix = self._locations[name]
+        return self.blocks[block_ix][1][:, col_ix]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._locations
+
+    def __len__(self) -> int:
+        return 0 if len(self.blocks) == 0 else len(self.blocks[0][1])
+
+    def __repr__(self) -> str:
+        return (
+            f"WideTable({len(self)} rows x {len(self._locations)} columns "
+            f"in {len(self.blocks)} blocks)"
+        )
+
+
+def _plan_runs(
+    dt: np.dtype, plan: tuple[tuple[str, str, Number, Number], ...]
+) -> list[dict]:
+    """
+    Group the fields of a column plan into runs of adjacent fields that share
+    a base dtype, conversion kind, and scaling. Fields that decode to Python
+    objects (EBCDIC text, void/bit strings) are never grouped.
+    """
+    runs = []
+    for name, kind, scale, offset in plan:
+        field_dtype, start = dt.fields[name][:2]
+        if field_dtype.names is not None or (
+            field_dtype.base.names is not None
+        ):
+            raise NotImplementedError(
+                "nested structured fields in binary tables are not supported"
+            )
+        base, shape = field_dtype.base, field_dtype.shape
+        n_items = int(np.prod(shape)) if len(shape) > 0 else 1
+        if len(shape) == 0:
+            names = [name]
+        else:
+            names = [f"{name}_{ix}" for ix in range(n_items)]
+        groupable = kind != "ebcdic" and base.kind != "V"
+        signature = (base, kind, scale, offset)
+        if (
+            groupable
+            and len(runs) > 0
+            and runs[-1]["groupable"]
+            and runs[-1]["signature"] == signature
+            and runs[-1]["end"] == start
+        ):
+            runs[-1]["names"] += names
+            runs[-1]["end"] += n_items * base.itemsize
             continue
-        func = vax.from_vax32  # TODO: if field['BYTES'] == 4 else vax.from_vax64
-        converted = func(data[field['NAME']].values)
-        reals[field['NAME']] = converted
-    for k, v in reals.items():
-        data[k] = v
-    return data
+        runs.append(
+            {
+                "names": names,
+                "signature": signature,
+                "groupable": groupable,
+                "start": start,
+                "end": start + n_items * base.itemsize,
+            }
+        )
+    return runs
+
+
+def wide_table_from_records(
+    records: np.ndarray,
+    dt: np.dtype,
+    plan: tuple[tuple[str, str, Number, Number], ...]
+) -> WideTable:
+    """
+    Build a WideTable from the raw bytes of a binary table, expressed as a
+    2D (rows, record length) uint8 array, using its structured dtype and
+    column plan (see `compile_column_plan()`).
+    """
+    blocks = []
+    for run in _plan_runs(dt, plan):
+        base, kind, scale, offset = run["signature"]
+        raw = np.ascontiguousarray(records[:, run["start"]:run["end"]])
+        items = raw.view(base)
+        if run["groupable"]:
+            block = _scale_column(_convert_column(items, kind), scale, offset)
+        else:
+            block = np.column_stack(
+                [
+                    np.asarray(_convert_column(items[:, ix], kind), dtype="O")
+                    for ix in range(items.shape[1])
+                ]
+            )
+        blocks.append((run["names"], block))
+    return WideTable(blocks)
@@ -228,7 +228,9 @@ class Data:
         skip_existence_check: bool = False,
         pvl_limit: int = DEFAULT_PVL_LIMIT,
         tracker: Optional[TrivialTracker] = None,
-        strict_label_decode: bool = True
+        strict_label_decode: bool = True,
+        memmap: bool = False,
+        delimited_workers: Optional[int] = None
     ):
         """"""
         # Bail out early if someone's trying to load directly from the network.
@@ -240,6 +242,11 @@ class Data:
         # do we raise an exception rather than a warning if loading a data
         # object fails?
         self.debug = debug
+        # do we memory-map PDS4 arrays by default rather than reading them?
+        self.memmap = memmap
+        # how many worker processes do we parse PDS4 delimited tables in?
+        # None (or 1) means parse them in this process.
+        self.delimited_workers = delimited_workers
         self.filename = check_cases(Path(fn).absolute(), skip_existence_check)
         self.loaders = {}
         if (self.debug is True) and (tracker is None):
@@ -256,6 +263,8 @@ class Data:
         self.file_mapping = {}
         # known special constants per data object
         self.specials = {}
+        # (min, max) per data object, saved from special constant scans
+        self.value_ranges = {}
         # dict to flag images loaded prescaled (currently only from FITS files)
         self._scaleflags = {}
         # where can we look for files containing data objects?
@@ -550,8 +559,11 @@ class Data:
                 f"{name} is already loaded; pass reload=True to "
                 f"force reload."
             )
+        # cached special constants may not describe the reloaded object
+        self.specials.pop(name, None)
+        self.value_ranges.pop(name, None)
         if self.standard == "PDS4":
-            return self._load_pds4(name)
+            return self._load_pds4(name, **load_kwargs)
         if self.standard == "FITS":
             self._add_loaded_objects(self._load_primary_fits(name))
             return
@@ -619,6 +631,56 @@ class Data:
             except AlreadyLoadedError:
                 continue
 
+    def iter_table(
+        self,
+        name: str,
+        chunk_rows: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        **load_kwargs: Any
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a PDS3 binary table in chunks of `chunk_rows` rows, yielding
+        each chunk as a DataFrame. Chunks are processed just as they would be
+        by `Data.load()`, so memory use is bounded by `chunk_rows` rather than
+        by the size of the table. `chunk_rows` defaults to
+        `pdr.loaders.table.DEFAULT_CHUNK_ROWS`. If `columns` is specified,
+        yield only those columns. Does not assign the table to `self`, but
+        does record the path to its file in `self.file_mapping`.
+
+        Note that tables with special-case readers are always read through
+        the generic binary table reader by this method.
+        """
+        from pdr.loaders.datawrap import IterTable, ReadTable
+        from pdr.loaders.dispatch import pointer_to_loader
+        from pdr.loaders.table import DEFAULT_CHUNK_ROWS
+
+        if chunk_rows is None:
+            chunk_rows = DEFAULT_CHUNK_ROWS
+        if name not in self.index:
+            raise KeyError(f"{name} not found in index: {self.index}.")
+        if self.standard != "PDS3":
+            raise NotImplementedError(
+                "iter_table() only supports PDS3 tables."
+            )
+        if not isinstance(pointer_to_loader(name, self), ReadTable):
+            raise TypeError(f"{name} does not appear to be a table.")
+        if self.file_mapping.get(name) is None:
+            target = self._target_path(name)
+            if target is None:
+                raise FileNotFoundError(
+                    f"{name} file {self._object_to_filename(name)} not found."
+                )
+            self.file_mapping[name] = target
+        self.tracker.set_metadata(filename=self.file_mapping[name], obj=name)
+        return IterTable()(
+            self,
+            name,
+            tracker=self.tracker,
+            chunk_rows=chunk_rows,
+            columns=columns,
+            **load_kwargs
+        )[name]
+
     def _file_not_found(self, object_name: str):
         """Implements default file-not-found behavior."""
         message = (
@@ -711,7 +773,14 @@ class Data:
 
         return None
 
-    def _load_pds4(self, object_name: str):
+    def _load_pds4(
+        self,
+        object_name: str,
+        memmap: Optional[bool] = None,
+        lazy_table: Optional[bool] = None,
+        delimited_workers: Optional[int] = None,
+        **_
+    ):
         """
         Load this object however pds4_tools wants to load this object, then
         reformat to DataFrame, expose the array handle in accordance with our
@@ -719,6 +788,21 @@ class Data:
 
         If the object is from a FITS file, preempt all that behavior and send
         it to our internal FITS-loading workflow.
+
+        If the object is an array and `memmap` is True (or None and
+        `self.memmap` is True), memory-map it rather than reading it, so that
+        only the parts of it that are actually accessed are read from disk.
+        The memory map is copy-on-write: modifying the array never modifies
+        the file.
+
+        If the object is a table and `lazy_table` is True, load it as a
+        `LazyTable`, which reads and converts each field only when one of its
+        columns is first accessed.
+
+        If the object is a delimited table and `delimited_workers` (or, if it
+        is None, `self.delimited_workers`) is greater than 1, parse it in up to
+        that many worker processes. Note that scripts that do this may need to
+        guard their entry points with `if __name__ == "__main__"`.
         """
         structure = self._pds4_structures[object_name]
         from pdr.pds4_tools.reader.label_objects import Label
@@ -747,13 +831,28 @@ class Data:
         elif structure.is_array():
             import numpy as np
 
+            if (self.memmap if memmap is None else memmap) is True:
+                # must be set before pds4_tools first reads the data
+                structure._memmap = True
             setattr(self, object_name, np.asarray(structure.data))
+        elif structure.is_table() and lazy_table is True:
+            from pdr.pd_utils import pds4_lazy_table
+
+            structure._max_workers = (
+                self.delimited_workers
+                if delimited_workers is None
+                else delimited_workers
+            )
+            setattr(self, object_name, pds4_lazy_table(structure))
         elif structure.is_table():
-            from pdr.pd_utils import structured_array_to_df
+            from pdr.pd_utils import pds4_structured_array_to_df
 
-            df = structured_array_to_df(structure.data)
-            df.columns = df.columns.str.replace(r"GROUP_?\d+", "", regex=True)
-            df.columns = df.columns.str.strip(", ")
+            structure._max_workers = (
+                self.delimited_workers
+                if delimited_workers is None
+                else delimited_workers
+            )
+            df = pds4_structured_array_to_df(structure.data)
             setattr(self, object_name, df)
         # TODO: do other important cases exist?
         else:
@@ -889,27 +988,39 @@ class Data:
         if self.standard != "PDS3":
             return obj
 
-        from pdr._scaling import mask_specials, scale_array
+        from pdr._scaling import scale_array
 
-        if object_name not in self.specials:
-            self.specials[object_name] = self.find_special_constants(
-                object_name
-            )
-        if self.specials[object_name] != {}:
-            obj = mask_specials(obj, list(self.specials[object_name].values()))
-        return scale_array(self, obj, object_name, inplace, float_dtype)
+        scaled = scale_array(
+            self,
+            obj,
+            object_name,
+            inplace,
+            float_dtype,
+            list(self.find_special_constants(object_name).values()),
+            self.value_ranges.get(object_name)
+        )
+        if inplace is True:
+            # obj may have been modified, so our cached scans of it are stale
+            self.specials.pop(object_name, None)
+            self.value_ranges.pop(object_name, None)
+        return scaled
 
     def find_special_constants(self, object_name: str) -> dict[str, Number]:
         """
         look up or infer special constants for one of our data objects.
-        in general, only works well on ndarrays.
+        in general, only works well on ndarrays. results are cached, because
+        inferring them requires scanning the whole object.
         """
-        if len(consts := special_image_constants(self.identifiers)) > 0:
-            return consts
-
-        from pdr._scaling import find_special_constants
+        if object_name in self.specials:
+            return self.specials[object_name]
+        if len(consts := special_image_constants(self.identifiers)) == 0:
+            from pdr._scaling import find_special_constants
 
-        return find_special_constants(self, self[object_name], object_name)
+            consts = find_special_constants(
+                self, self[object_name], object_name
+            )
+        self.specials[object_name] = consts
+        return consts
 
     def metaget(
         self, text: str, default: Any = None, warn: bool = True
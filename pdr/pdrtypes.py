@@ -55,6 +55,9 @@ class ImageProps(TypedDict):
     BYTES_PER_PIXEL: Literal[1, 2, 4, 8]
     # Do the elements of the array, when loaded, represent VAX reals?
     is_vax_real: bool
+    # VAX floating-point format of those reals ("F", "D", or "G"; None if
+    # they are not VAX reals)
+    vax_format: Optional[Literal["F", "D", "G"]]
     # numpy dtype string
     sample_type: str
     # total number of elements
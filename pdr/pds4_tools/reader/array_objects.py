@@ -184,7 +184,7 @@ class ArrayStructure(Structure):
         super(ArrayStructure, self).data()
 
         from .read_arrays import read_array_data
-        read_array_data(self, no_scale=self._no_scale, masked=self._masked, memmap=False)
+        read_array_data(self, no_scale=self._no_scale, masked=self._masked, memmap=self._memmap)
 
         return self.data
 
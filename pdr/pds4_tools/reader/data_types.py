@@ -413,6 +413,67 @@ def data_type_convert_array(data_type, byte_string):
     return byte_string
 
 
+def _convert_table_ascii_array(data_type, data, dtype, mask_nulls=False):
+    """
+    Bulk (vectorized) conversion of PDS4 ASCII numeric or boolean values into their proper data type. See
+    `data_type_convert_table_ascii`, which calls this method, for details.
+
+    Parameters
+    ----------
+    data_type : PDSdtype
+        The PDS4 data type that the data should be cast to.
+    data : np.ndarray
+        Flat array of fixed-length byte strings.
+    dtype : np.dtype
+        The numeric or boolean NumPy dtype for *data_type*.
+    mask_nulls : bool, optional
+        If True, then empty values are masked out and a masked array is returned.
+
+    Returns
+    -------
+    np.ndarray, np.ma.MaskedArray or None
+        Data cast into values having *dtype*. None if some value could not be converted in bulk (e.g. an
+        integer too large for *dtype*, or an invalid value), in which case the general conversion should be
+        used, in order to obtain its result or error.
+    """
+
+    mask_array = np.zeros(0, dtype='bool')
+
+    # Values only need to be stripped to find nulls and booleans; NumPy ignores surrounding whitespace when
+    # casting strings to numeric types
+    if mask_nulls or (data_type == 'ASCII_Boolean'):
+        data = np.char.strip(data)
+
+    if mask_nulls:
+        mask_array = (data == b'')
+
+        if mask_array.any():
+            data = np.where(mask_array, b'0', data)
+
+    try:
+
+        if data_type == 'ASCII_Boolean':
+
+            is_true = (data == b'true') | (data == b'1')
+            if not (is_true | (data == b'false') | (data == b'0')).all():
+                return None
+
+            data = is_true.astype(dtype)
+
+        else:
+            data = data.astype(dtype)
+
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+    if mask_array.any():
+        data = data.view(np.ma.masked_array)
+        data.mask = mask_array
+        data.set_fill_value(0)
+
+    return data
+
+
 @rename_parameter('1.3', 'mask_numeric_nulls', 'mask_nulls')
 def data_type_convert_table_ascii(data_type, data, mask_nulls=False, decode_strings=False):
     """
@@ -448,6 +509,17 @@ def data_type_convert_table_ascii(data_type, data, mask_nulls=False, decode_stri
     # Obtain dtype that these data will take
     dtype = pds_to_numpy_type(data_type, decode_strings=decode_strings)
 
+    # Convert numeric and boolean data in bulk, from an array of fixed-length byte strings, if possible
+    if np.dtype(dtype).kind in 'biuf':
+
+        byte_strings = np.asarray(data)
+
+        if byte_strings.dtype.kind == 'S':
+
+            converted = _convert_table_ascii_array(data_type, byte_strings, dtype, mask_nulls=mask_nulls)
+            if converted is not None:
+                return converted
+
     # Stores mask and fill value used when *mask_nulls* is enabled
     # (a fill value of None uses NumPy's default for the data type)
     mask_array = np.zeros(0)
@@ -556,7 +628,8 @@ def data_type_convert_table_binary(data_type, data, decode_strings=False):
     data_type : str, unicode or PDSdtype
         The PDS4 data type that the data should be cast to.
     data : array_like[str or bytes]
-        Flat array of PDS4 byte strings from a Table_Binary data structure.
+        Flat array of PDS4 byte strings from a Table_Binary data structure. May be a contiguous
+        fixed-length byte string ``np.ndarray``, in which case binary data is viewed rather than joined.
     decode_strings : bool, optional
         If True, and the returned dtype is a form of character, then the obtained dtype will be a form of
         unicode. If False, then for character data the obtained dtype will remain byte strings. Defaults
@@ -574,8 +647,13 @@ def data_type_convert_table_binary(data_type, data, decode_strings=False):
     # Convert binary data types
     if data_type.issubtype('binary'):
 
+        # View contiguous byte string arrays directly as their underlying bytes
+        if isinstance(data, np.ndarray) and data.flags['C_CONTIGUOUS'] and data.flags['WRITEABLE']:
+            byte_string = data.view('uint8')
+
         # Join data array-like back into a byte_string, then cast to bytearray to ensure mutability
-        byte_string = bytearray(b''.join(data))
+        else:
+            byte_string = bytearray(b''.join(data))
 
         data = data_type_convert_array(data_type, byte_string)
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import sys
 import abc
+from xml.etree import ElementTree as ET
 
 from ..utils.compat import OrderedDict
 from ..utils.helpers import xml_to_dict, is_array_like
@@ -328,11 +329,14 @@ class Structure(object):
         if structure_data is not None:
             self.data = structure_data
 
-        # Controls whether data read-in from file will be scaled, whether it will be masked and
-        # whether byte strings will be decoded to unicode
+        # Controls whether data read-in from file will be scaled, whether it will be masked,
+        # whether byte strings will be decoded to unicode, whether it will be memory mapped
+        # (arrays only) and how many worker processes it will be parsed in (delimited tables only)
         self._no_scale = None
         self._masked = None
         self._decode_strings = None
+        self._memmap = False
+        self._max_workers = None
 
     def __repr__(self):
         """
@@ -549,7 +553,8 @@ class Meta_Class(OrderedDict):
         """
         return NotImplementedError
 
-    def _load_keys_from_xml(self, xml, cast_values=True, cast_ignore=_DEFAULT_CAST_IGNORE, tag_modify=()):
+    def _load_keys_from_xml(self, xml, cast_values=True, cast_ignore=_DEFAULT_CAST_IGNORE, tag_modify=(),
+                            skip_tag=None):
         """ Loads keys into self from XML.
 
         Parameters
@@ -567,12 +572,22 @@ class Meta_Class(OrderedDict):
         tag_modify : tuple, optional
             2-valued tuple with str or unicode elements, or tuple of 2-valued tuples. See description in
             `xml_to_dict`.
+        skip_tag : str or unicode, optional
+            If given, child elements of *xml* with this tag are not loaded.
 
         Returns
         -------
         None
         """
 
+        if skip_tag is not None:
+
+            root = xml.getroot() if hasattr(xml, 'getroot') else xml
+
+            xml = ET.Element(root.tag, root.attrib)
+            xml.text = root.text
+            xml.extend(child for child in root if child.tag != skip_tag)
+
         items = list(xml_to_dict(xml, skip_attributes=True, cast_values=cast_values,
                                  cast_ignore=cast_ignore, tag_modify=tag_modify).values())[0]
 
@@ -4,6 +4,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
 from math import log10
 
@@ -25,6 +26,10 @@ from ..extern.six.moves import range
 # Initialize the logger
 logger = logger_init()
 
+# Approximate size, in bytes, of the chunks of records a delimited table is split into when it is parsed
+# in parallel worker processes (see the *max_workers* argument of `read_table_data`).
+DELIMITED_CHUNK_BYTES = 2 ** 24
+
 #################################
 
 
@@ -299,6 +304,90 @@ def _extract_fixed_width_field_data(extracted_data, table_byte_data,
         extracted_data.append(table_byte_data[start_byte:stop_byte])
 
 
+def _fixed_width_records(table_byte_data, num_records, record_length):
+    """ View the byte data of a fixed-width (Character or Binary) table as a 2D array of records.
+
+    Parameters
+    ----------
+    table_byte_data : str, bytes or buffer
+        Byte data for the entire table.
+    num_records : int
+        Number of records in the table.
+    record_length : int
+        Length of each record in the table, in bytes.
+
+    Returns
+    -------
+    np.ndarray or None
+        A (num_records, record_length) uint8 view of *table_byte_data*, or None if *table_byte_data*
+        is too short to contain every record (e.g., because the file is truncated).
+    """
+
+    table_bytes = np.frombuffer(table_byte_data, dtype='uint8')
+
+    if table_bytes.size < num_records * record_length:
+        return None
+
+    return table_bytes[:num_records * record_length].reshape(num_records, record_length)
+
+
+def _extract_fixed_width_field_array(records, field_length, field_location, array_shape,
+                                     group_locations=(), repetition_lengths=()):
+    """
+    Vectorized equivalent of `_extract_fixed_width_field_data`. Extracts data for a single field in a
+    fixed-width (Character or Binary) table, including all of its repetitions inside group fields,
+    with a single NumPy indexing operation rather than one slice per element.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        A (records, record_length) uint8 array, as returned by `_fixed_width_records`.
+    field_length : int
+        Length of each element in the field, in bytes.
+    field_location : int
+        Location of the first element in the field, in bytes, from the beginning of the record.
+    array_shape : array_like[int]
+        Sequence of dimensions for the field. First element is the number of records, all other
+        elements are the number of repetitions for each GROUP the field is inside of, if any.
+    group_locations : array_like[int], optional
+        If this field is inside at least one group field, the array must contain the location of the
+        first element of the first repetition (i.e, group_location), in bytes, of each group.
+    repetition_lengths : array_like[int], optional
+        If this field is inside at least one group field, the array must contain the group length divided
+        by the number of repetitions (i.e, group_length/repetitions), in bytes, for each group.
+
+    Returns
+    -------
+    np.ndarray
+        A flat array of fixed-length byte strings (one per element of the field), in the same order
+        `_extract_fixed_width_field_data` would extract them. The array is C-contiguous, such that
+        viewing it as uint8 gives the joined byte data of the field.
+    """
+
+    # Simplified case for fields that are not inside group fields
+    if len(array_shape) == 1:
+        field_bytes = np.ascontiguousarray(records[:, field_location:field_location + field_length])
+        return field_bytes.view('S{0}'.format(field_length)).reshape(-1)
+
+    # Compute the offset, from the beginning of a record, of each repetition of the field. Offsets vary
+    # fastest along the innermost group, matching the order of itertools.product in
+    # `_extract_fixed_width_field_data`.
+    repetitions = array_shape[1:]
+    offsets = np.full(repetitions, field_location, dtype='int64')
+
+    for i, (location, length) in enumerate(zip(group_locations, repetition_lengths)):
+
+        broadcast_shape = [1] * len(repetitions)
+        broadcast_shape[i] = repetitions[i]
+        offsets = offsets + (location + length * np.arange(repetitions[i])).reshape(broadcast_shape)
+
+    byte_indices = offsets.reshape(-1, 1) + np.arange(field_length)
+
+    field_bytes = records[:, byte_indices].reshape(-1, field_length)
+
+    return field_bytes.view('S{0}'.format(field_length)).reshape(-1)
+
+
 def _extract_delimited_field_data(extracted_data, table_byte_data, start_bytes, current_column, array_shape,
                                   skip_factors=()):
     """
@@ -466,6 +555,26 @@ def _get_delimited_records_and_start_bytes(records, table_structure, table_manif
         above for difference between column as referred to here and PDS4 fields.
     """
 
+    field_delimiter = _get_field_delimiter(table_structure)
+    num_columns = _get_num_delimited_columns(table_manifest)
+
+    return _find_delimited_start_bytes(records, field_delimiter, num_columns)
+
+
+def _get_field_delimiter(table_structure):
+    """ Obtain the field delimiter of a delimited table, as bytes.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for the delimited table.
+
+    Returns
+    -------
+    bytes
+        The field delimiter.
+    """
+
     # Extract the proper record delimiter (as bytes, for compatibility with Python 3)
     delimiter_name = table_structure.meta_data['field_delimiter'].lower()
     field_delimiter = {'comma': b',',
@@ -474,10 +583,49 @@ def _get_delimited_records_and_start_bytes(records, table_structure, table_manif
                        'vertical bar': b'|'
                       }.get(delimiter_name, None)
 
-    # Determine total number of columns (if we split the record by record delimiter) in each record.
-    # A column is either a field or if there's a GROUP then it's one of the repetitions of a field.
-    # This number, as are other references to this number in the code, are corrected for cases where
-    # we ignore the record delimiter as its effectively escaped by being between bounding double quotes.
+    return field_delimiter
+
+
+def _get_record_delimiter(table_structure):
+    """ Obtain the record delimiter of a delimited table, as bytes.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for the delimited table.
+
+    Returns
+    -------
+    bytes
+        The record delimiter.
+    """
+
+    delimiter_name = table_structure.meta_data['record_delimiter'].lower()
+    record_delimiter = {'line-feed': b'\n',
+                        'carriage-return line-feed': b'\r\n'
+                       }.get(delimiter_name, None)
+
+    return record_delimiter
+
+
+def _get_num_delimited_columns(table_manifest):
+    """ Obtain the total number of columns (if we split the record by delimiter) in each record.
+
+    A column is either a field or if there's a GROUP then it's one of the repetitions of a field.
+    This number, as are other references to this number in the code, are corrected for cases where
+    we ignore the record delimiter as its effectively escaped by being between bounding double quotes.
+
+    Parameters
+    ----------
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 delimited table.
+
+    Returns
+    -------
+    int
+        The number of columns in each record.
+    """
+
     num_columns = 0
 
     for field in table_manifest.fields():
@@ -491,6 +639,31 @@ def _get_delimited_records_and_start_bytes(records, table_structure, table_manif
 
         num_columns += 1 if (not repetitions) else reduce(lambda x, y: x*y, repetitions)
 
+    return num_columns
+
+
+def _find_delimited_start_bytes(records, field_delimiter, num_columns):
+    """ Obtain the start byte of each column for each record of a delimited table.
+
+    See `_get_delimited_records_and_start_bytes` for details. Takes only the field delimiter and number
+    of columns, rather than the table structure and manifest, such that chunks of records can be
+    processed in separate worker processes.
+
+    Parameters
+    ----------
+    records : list[str or bytes]
+        The data for the delimited table, split into records.
+    field_delimiter : bytes
+        The field delimiter of the table.
+    num_columns : int
+        Total number of columns in each record.
+
+    Returns
+    -------
+    list[str or bytes], list[array_like]
+        The records for the table, modified to remove quotes; and the start bytes of each column.
+    """
+
     # Pre-allocate ``list``, which will store NumPy ndarray's, containing the start byte of each field
     # for each record. Thus `start_bytes` is a two-dimensional array_like, where the first dimension is
     # the field and the second dimension is the record, with the value being the start byte of the data
@@ -607,6 +780,185 @@ def _get_delimited_records_and_start_bytes(records, table_structure, table_manif
     return records, start_bytes
 
 
+def _split_delimited_chunks(table_byte_data, record_delimiter, num_records, chunk_bytes):
+    """ Find the bounds of chunks of the byte data of a delimited table that each contain only whole records.
+
+    Parameters
+    ----------
+    table_byte_data : str, bytes or buffer
+        Byte data for the entire table.
+    record_delimiter : bytes
+        The record delimiter of the table.
+    num_records : int
+        Number of records in the table. Any data past this many records is excluded.
+    chunk_bytes : int
+        Approximate size of each chunk, in bytes. Chunks are extended to the end of their last record.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        The start and stop byte of each chunk, and the number of records to read from it.
+    """
+
+    chunks = []
+    start = 0
+    remaining_records = num_records
+    data_length = len(table_byte_data)
+
+    while (remaining_records > 0) and (start < data_length):
+
+        stop = table_byte_data.find(record_delimiter, min(start + chunk_bytes, data_length) - 1)
+        stop = data_length if (stop == -1) else stop + len(record_delimiter)
+
+        chunk_records = table_byte_data.count(record_delimiter, start, stop)
+        if not table_byte_data.endswith(record_delimiter, start, stop):
+            chunk_records += 1
+
+        chunk_records = min(chunk_records, remaining_records)
+        chunks.append((start, stop, chunk_records))
+
+        remaining_records -= chunk_records
+        start = stop
+
+    return chunks
+
+
+def _read_delimited_chunk(chunk, num_records, record_delimiter, field_delimiter, num_columns, field_specs):
+    """ Extract and convert the data of every field from a chunk of a delimited table.
+
+    Module-level, and taking only picklable arguments, such that it can run in a worker process.
+
+    Parameters
+    ----------
+    chunk : bytes
+        Byte data for the chunk, containing only whole records.
+    num_records : int
+        Number of records to read from *chunk*.
+    record_delimiter : bytes
+        The record delimiter of the table.
+    field_delimiter : bytes
+        The field delimiter of the table.
+    num_columns : int
+        Total number of columns in each record.
+    field_specs : list[tuple]
+        For each field (excluding Uniformly Sampled fields), a tuple of its name, data type, column offset,
+        group repetitions and skip factors. See `_extract_delimited_field_data` for the latter three.
+
+    Returns
+    -------
+    list[np.ndarray or np.ma.MaskedArray]
+        Flat data for each field in *field_specs*, cast to its initial data type.
+    """
+
+    records = chunk.split(record_delimiter)[0:num_records]
+    records, start_bytes = _find_delimited_start_bytes(records, field_delimiter, num_columns)
+
+    fields_data = []
+
+    for name, data_type, current_column, group_shape, skip_factors in field_specs:
+
+        extracted_data = []
+        array_shape = (len(records), ) + tuple(group_shape)
+        _extract_delimited_field_data(extracted_data, records, start_bytes,
+                                      current_column, array_shape, skip_factors)
+
+        try:
+            extracted_data = data_type_convert_table_ascii(data_type, extracted_data,
+                                                           mask_nulls=True, decode_strings=False)
+        except ValueError as e:
+            six.raise_from(ValueError("Unable to convert field '{0}' to data_type '{1}': {2}"
+                                      .format(name, data_type, repr(e.args[0]))), None)
+
+        fields_data.append(extracted_data)
+
+    return fields_data
+
+
+def _read_delimited_fields(table_byte_data, table_structure, table_manifest, fields=None, max_workers=None):
+    """ Extract and convert the data of fields in a delimited table.
+
+    By default, the byte data is parsed and converted in this process, all at once. If *max_workers* is
+    greater than 1, it is instead split into chunks of whole records (see ``DELIMITED_CHUNK_BYTES``), which
+    are parsed and converted in up to *max_workers* worker processes, and the typed field data of each chunk
+    is then concatenated.
+
+    Parameters
+    ----------
+    table_byte_data : str, bytes or buffer
+        Byte data for the entire table.
+    table_structure : TableStructure
+        The PDS4 Table data structure for the delimited table.
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 delimited table.
+    fields : list[Meta_Field], optional
+        The fields (from *table_manifest*) to extract. Defaults to all fields, excluding Uniformly
+        Sampled fields.
+    max_workers : int, optional
+        Maximum number of worker processes to parse the table in. Defaults to None, parsing it in this
+        process. Note that worker processes may be started with the spawn method, which requires scripts
+        that read tables this way to guard their entry points with ``if __name__ == '__main__'``.
+
+    Returns
+    -------
+    list[np.ndarray or np.ma.MaskedArray]
+        Flat data for each field in *fields*, cast to its initial data type.
+    """
+
+    if fields is None:
+        fields = table_manifest.fields(skip_uniformly_sampled=True)
+
+    field_specs = []
+
+    for field in fields:
+
+        field_idx = table_manifest.index(field)
+        field_specs.append((field['name'], field.data_type().name, table_manifest.get_field_offset(field_idx),
+                            tuple(field.shape[1:]), table_manifest.get_field_skip_factors(field_idx)))
+
+    num_records = table_structure.meta_data['records']
+    record_delimiter = _get_record_delimiter(table_structure)
+
+    args = (record_delimiter, _get_field_delimiter(table_structure),
+            _get_num_delimited_columns(table_manifest), field_specs)
+
+    chunks = []
+    if (max_workers is not None) and (max_workers > 1):
+        chunks = _split_delimited_chunks(table_byte_data, record_delimiter, num_records,
+                                         DELIMITED_CHUNK_BYTES)
+
+    # Parse in this process, without copying the byte data
+    if len(chunks) <= 1:
+        chunks_data = [_read_delimited_chunk(table_byte_data, num_records, *args)]
+
+    # Parse in worker processes; each worker receives only its own chunk
+    else:
+        byte_view = memoryview(table_byte_data)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_read_delimited_chunk, bytes(byte_view[start:stop]), chunk_records, *args)
+                       for start, stop, chunk_records in chunks]
+            chunks_data = [future.result() for future in futures]
+
+    fields_data = []
+
+    for i in range(0, len(field_specs)):
+
+        field_chunks = [chunk_data[i] for chunk_data in chunks_data]
+
+        if len(field_chunks) == 0:
+            fields_data.append(np.empty(0, dtype=pds_to_numpy_type(field_specs[i][1])))
+
+        elif len(field_chunks) == 1:
+            fields_data.append(field_chunks[0])
+
+        elif any(isinstance(chunk_data, np.ma.MaskedArray) for chunk_data in field_chunks):
+            fields_data.append(np.ma.concatenate(field_chunks))
+
+        else:
+            fields_data.append(np.concatenate(field_chunks))
+
+    return fields_data
+
+
 def new_table(fields, no_scale=False, decode_strings=False, masked=None, copy=True, **structure_kwargs):
     """ Create a `TableStructure` from PDS-compliant data or meta data.
 
@@ -814,7 +1166,7 @@ def table_data_size_check(table_structure, quiet=False):
     return False
 
 
-def read_table_data(table_structure, no_scale, decode_strings, masked):
+def read_table_data(table_structure, no_scale, decode_strings, masked, max_workers=None):
     """
     Reads and properly formats the data for a single PDS4 table structure, modifies *table_structure* to
     contain all extracted fields for said table.
@@ -831,6 +1183,9 @@ def read_table_data(table_structure, no_scale, decode_strings, masked):
     decode_strings : bool
         If True, character data types contained in the returned data will be decoded to the ``unicode`` type
         in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+    max_workers : int, optional
+        If greater than 1, parse delimited tables in up to this many worker processes. Defaults to None,
+        parsing them in this process.
 
     Returns
     -------
@@ -840,44 +1195,97 @@ def read_table_data(table_structure, no_scale, decode_strings, masked):
     # Provide a warning to the user if the data is large and may take a while to read
     table_data_size_check(table_structure)
 
+    table_structure.data = read_table_fields(table_structure, None, no_scale=no_scale,
+                                             decode_strings=decode_strings, masked=masked,
+                                             max_workers=max_workers)
+
+
+def read_table_fields(table_structure, field_names, no_scale, decode_strings, masked, max_workers=None,
+                      table_byte_data=None):
+    """
+    Reads and properly formats the data for some or all fields of a single PDS4 table structure. Only the
+    requested fields are extracted and converted, which is much faster than reading the entire table when
+    only some of its fields are needed.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure to read fields from. Should have been initialized via
+        `TableStructure.from_file` method.
+    field_names : array_like[str or unicode] or None
+        The names of the fields to read, as they appear in the table's structured data array (i.e., the
+        full name of the field, see `Meta_TableElement.full_name`). If None, all fields are read.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    masked : bool
+        Returned data will have numeric Special_Constants masked.
+    decode_strings : bool
+        If True, character data types contained in the returned data will be decoded to the ``unicode`` type
+        in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+    max_workers : int, optional
+        If greater than 1, parse delimited tables in up to this many worker processes. Defaults to None,
+        parsing them in this process.
+    table_byte_data : str or bytes, optional
+        The byte data of the table, as returned by `_read_table_byte_data`. Callers that read fields of
+        the same table repeatedly can pass it to avoid re-reading the data file. Defaults to None, in
+        which case it is read from the data file.
+
+    Returns
+    -------
+    PDS_ndarray or PDS_marray
+        A structured array containing the requested fields, in the order they appear in the table.
+    """
+
     # Obtain the byte data of the table
-    table_byte_data = _read_table_byte_data(table_structure)
+    if table_byte_data is None:
+        table_byte_data = _read_table_byte_data(table_structure)
 
     # Obtain a manifest for the table, which describes the table structure (the fields and groups)
     table_manifest = TableManifest.from_label(table_structure.label)
 
+    # Determine which fields to read
+    def is_requested(field):
+        return (field_names is None) or (pds_to_numpy_name(field.full_name()) in field_names)
+
+    regular_fields = [field for field in table_manifest.fields(skip_uniformly_sampled=True)
+                      if is_requested(field)]
+
     # Extract the number of records
     num_records = table_structure.meta_data['records']
 
     # Stores the initial non-post-processed version of fields
     extracted_fields = []
 
-    # Special processing for delimited tables
-    if table_structure.meta_data.is_delimited():
-
-        delimiter_name = table_structure.meta_data['record_delimiter'].lower()
-        record_delimiter = {'line-feed': b'\n',
-                            'carriage-return line-feed': b'\r\n'
-                           }.get(delimiter_name, None)
+    # View fixed-width tables as 2D arrays of records, to extract fields from with NumPy
+    records = None
+    if table_structure.meta_data.is_fixed_width():
+        records = _fixed_width_records(table_byte_data, num_records,
+                                       table_structure.meta_data.record['record_length'])
 
-        # Split the byte data into records
-        table_byte_data = table_byte_data.split(record_delimiter)[0:num_records]
-
-        # Obtain adjusted records (to remove quotes) and start bytes (2D array_like, with first dimension
-        # the field number and the second dimension the record number, and the value set to the start byte
-        # of the data for those parameters).
-        table_byte_data, start_bytes = _get_delimited_records_and_start_bytes(table_byte_data,
-                                                                              table_structure, table_manifest)
+    # Delimited tables are parsed and converted in (possibly parallel) chunks of records
+    delimited_fields = None
+    if table_structure.meta_data.is_delimited():
+        delimited_fields = _read_delimited_fields(table_byte_data, table_structure, table_manifest,
+                                                  regular_fields, max_workers=max_workers)
 
     # Create data for the Uniformly Sampled fields
     for field in table_manifest.uniformly_sampled_fields():
 
+        if not is_requested(field):
+            continue
+
         created_data = _make_uniformly_sampled_field(table_structure, field)
         extracted_fields.append(PDS_array(created_data, field))
 
     # For each regular field, do initial read-in from byte data and conversion to its actual data type. No
     # post-processing is done in this loop (for example, no scaling and no conversion to unicode).
-    for field in table_manifest.fields(skip_uniformly_sampled=True):
+    for field_num, field in enumerate(regular_fields):
+
+        # Delimited table fields have already been extracted and converted
+        if delimited_fields is not None:
+            extracted_fields.append(PDS_array(delimited_fields[field_num], field))
+            delimited_fields[field_num] = None
+            continue
 
         # Field index in the manifest
         field_idx = table_manifest.index(field)
@@ -888,37 +1296,25 @@ def read_table_data(table_structure, no_scale, decode_strings, masked):
         # Create flat list that will contain the (flat) data for this Field
         extracted_data = []
 
-        # Extract the byte data for the field (delimited tables)
-        if table_structure.meta_data.is_delimited():
+        # Extract the byte data for the field (fixed-width tables). Store the group_location and the
+        # group_length divided by the number of repetitions for each group the field is inside of
+        group_locations = []
+        repetition_lengths = []
 
-            # The current column represents which column of `start_bytes` has the data for the field being
-            # looped over. For fields inside groups, this is the column with the first repetition only.
-            current_column = table_manifest.get_field_offset(field_idx)
+        parent_idx = field_idx
+        for parent_group in table_manifest.get_parents_by_idx(parent_idx):
+            group_locations.insert(0, parent_group['location'] - 1)
+            repetition_lengths.insert(0, parent_group['length'] // parent_group['repetitions'])
 
-            # Obtain the skip factors for this field, necessary to determine the columns containing
-            # field repetitions (only relevant for fields inside groups)
-            skip_factors = table_manifest.get_field_skip_factors(field_idx)
+        record_length = table_structure.meta_data.record['record_length']
 
-            # Extract data for the current field
-            _extract_delimited_field_data(extracted_data, table_byte_data,
-                                          start_bytes, current_column, array_shape, skip_factors)
+        # Extract data for the current field, vectorized if possible
+        if records is not None:
+            extracted_data = _extract_fixed_width_field_array(records, field['length'],
+                                                              field['location'] - 1, array_shape,
+                                                              group_locations, repetition_lengths)
 
-        # Extract the byte data for the field (fixed-width tables)
         else:
-
-            # Store the group_location and the group_length divided by the number of repetitions for each
-            # group the field is inside of (added in for loop below)
-            group_locations = []
-            repetition_lengths = []
-
-            parent_idx = field_idx
-            for parent_group in table_manifest.get_parents_by_idx(parent_idx):
-                group_locations.insert(0, parent_group['location'] - 1)
-                repetition_lengths.insert(0, parent_group['length'] // parent_group['repetitions'])
-
-            record_length = table_structure.meta_data.record['record_length']
-
-            # Extract data for the current field
             _extract_fixed_width_field_data(extracted_data, table_byte_data, field['length'],
                                             field['location'] - 1, record_length,
                                             array_shape, group_locations, repetition_lengths)
@@ -935,9 +1331,6 @@ def read_table_data(table_structure, no_scale, decode_strings, masked):
             elif table_structure.type == 'Table_Binary':
                 extracted_data = data_type_convert_table_binary(*args, **kwargs)
 
-            elif table_structure.meta_data.is_delimited():
-                extracted_data = data_type_convert_table_ascii(*args, mask_nulls=True, **kwargs)
-
             else:
                 raise TypeError('Unknown table type: {0}'.format(table_structure.type))
 
@@ -952,9 +1345,9 @@ def read_table_data(table_structure, no_scale, decode_strings, masked):
     # Delete table byte data to save RAM now that it is no longer needed (all fields have been extracted)
     del table_byte_data
 
-    # Finish processing (scale and decoding), create the table's structured data array and set fields
-    table_structure.data = new_table(extracted_fields, no_scale=no_scale, decode_strings=decode_strings,
-                                     masked=masked, copy=False).data
+    # Finish processing (scale and decoding), create the table's structured data array
+    return new_table(extracted_fields, no_scale=no_scale, decode_strings=decode_strings,
+                     masked=masked, copy=False).data
 
 
 def read_table(full_label, table_label, data_filename,
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import re
 import abc
 import sys
+import copy
 import numpy as np
 
 from .general_objects import Structure, Meta_Class, Meta_Structure
@@ -13,7 +14,7 @@ from .label_objects import Meta_SpectralCharacteristics
 from .data_types import pds_to_numpy_name, PDSdtype
 
 from ..utils.compat import OrderedDict
-from ..utils.helpers import is_array_like, dict_extract
+from ..utils.helpers import is_array_like, dict_extract, xml_to_dict
 from ..utils.exceptions import PDS4StandardsException
 from ..utils.logging import logger_init
 
@@ -24,9 +25,63 @@ from ..extern.cached_property import threaded_cached_property
 # Initialize the logger
 logger = logger_init()
 
+# Maximum number of entries in each of the table meta data caches below
+TABLE_META_CACHE_SIZE = 256
+
+# Caches of the meta data describing a table's <Record_*> (as loaded into `Meta_TableStructure`) and of
+# its `TableManifest`, keyed by `_table_fingerprint`. PDS4 collections often contain many labels whose
+# tables differ only in values such as <records> and <offset>; these are not part of the fingerprint and
+# are re-bound on each use.
+_record_meta_cache = OrderedDict()
+_manifest_cache = OrderedDict()
+
 #################################
 
 
+def _table_fingerprint(table_label):
+    """ Obtain a key describing the structure of a table, for the table meta data caches.
+
+    Parameters
+    ----------
+    table_label : Label or ElementTree Element
+        Portion of label that defines the PDS4 table data structure.
+
+    Returns
+    -------
+    tuple
+        The tag and text of every element inside the table's <Record_*> and <Uniformly_Sampled>, which
+        together define its fields and groups.
+    """
+
+    if hasattr(table_label, 'getroot'):
+        table_label = table_label.getroot()
+
+    return tuple((elem.tag, elem.text) for child in table_label
+                 if ('Record_' in child.tag) or (child.tag == 'Uniformly_Sampled')
+                 for elem in child.iter())
+
+
+def _cache_store(cache, key, value):
+    """ Store *value* in one of the table meta data caches, evicting its oldest entry if it is full. """
+
+    cache[key] = value
+
+    if len(cache) > TABLE_META_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _copy_meta_value(value):
+    """ Copy a (possibly nested) ``dict`` or ``list`` value as created by `xml_to_dict`. """
+
+    if isinstance(value, dict):
+        return OrderedDict((key, _copy_meta_value(item)) for key, item in six.iteritems(value))
+
+    elif isinstance(value, list):
+        return [_copy_meta_value(item) for item in value]
+
+    return value
+
+
 class TableStructure(Structure):
     """ Stores a single PDS4 table data structure.
 
@@ -360,7 +415,8 @@ class TableStructure(Structure):
         super(TableStructure, self).data()
 
         from .read_tables import read_table_data
-        read_table_data(self, no_scale=self._no_scale, decode_strings=self._decode_strings, masked=self._masked)
+        read_table_data(self, no_scale=self._no_scale, decode_strings=self._decode_strings, masked=self._masked,
+                        max_workers=self._max_workers)
 
         return self.data
 
@@ -432,6 +488,7 @@ class TableStructure(Structure):
             table_structure._no_scale = self._no_scale
             table_structure._decode_strings = self._decode_strings
             table_structure._masked = True
+            table_structure._max_workers = self._max_workers
 
         return table_structure
 
@@ -517,10 +574,22 @@ class Meta_TableStructure(Meta_Structure):
         """
 
         obj = cls()
-        obj._load_keys_from_xml(xml_table)
+        record_str = [elem.tag for elem in xml_table if 'Record_' in elem.tag][0]
+
+        # Meta data for the record (i.e., field and group definitions) is re-used from any previous table
+        # with identical structure. (<Record_*> is the last element of a table, so key order is preserved.)
+        fingerprint = _table_fingerprint(xml_table)
+        record_meta = _record_meta_cache.get(fingerprint)
+
+        if record_meta is None:
+            obj._load_keys_from_xml(xml_table)
+            _cache_store(_record_meta_cache, fingerprint, _copy_meta_value(obj[record_str]))
+
+        else:
+            obj._load_keys_from_xml(xml_table, skip_tag=record_str)
+            obj[record_str] = _copy_meta_value(record_meta)
 
         # Store record meta data with a variable name that is independent of the table-type
-        record_str = [elem.tag for elem in xml_table if 'Record_' in elem.tag][0]
         obj.type = record_str.split('_')[-1]
         obj.record = obj[record_str]
 
@@ -670,6 +739,13 @@ class TableManifest(collections_abc.Sequence):
             Instance containing all appropriate Meta_Field's and Meta_Group's.
         """
 
+        # Re-use the manifest of any previous table with identical structure
+        fingerprint = _table_fingerprint(table_label)
+        cached = _manifest_cache.get(fingerprint)
+
+        if cached is not None:
+            return cached._rebind(table_label)
+
         # Find the <Record_*> and set the table type (e.g. Character, Binary or Delimited)
         record_str = [elem.tag for elem in table_label if 'Record_' in elem.tag][0]
         record_xml = table_label.find(record_str)
@@ -692,6 +768,38 @@ class TableManifest(collections_abc.Sequence):
         # Perform basic sanity and basic validation checking on the table
         obj._validate_table(record_xml)
 
+        # Cache the manifest; callers always receive a copy, such that the cached one is never modified
+        _cache_store(_manifest_cache, fingerprint, obj)
+
+        return obj._rebind(table_label)
+
+    def _rebind(self, table_label):
+        """ Copy this manifest for another table that has identical structure.
+
+        Parameters
+        ----------
+        table_label : Label or ElementTree Element
+            Portion of label that defines the PDS4 table data structure the copy is for.
+
+        Returns
+        -------
+        TableManifest
+            A copy of this manifest, containing copies of its Meta_Field's and Meta_Group's, with field
+            shapes set for the number of records in *table_label*.
+        """
+
+        obj = TableManifest(table_type=self._table_type, table_label=table_label)
+        num_records = obj.num_records
+
+        for item in self._struct:
+
+            item = copy.copy(item)
+
+            if getattr(item, 'shape', None) is not None:
+                item.shape = (num_records, ) + tuple(item.shape[1:])
+
+            obj._struct.append(item)
+
         return obj
 
     @property
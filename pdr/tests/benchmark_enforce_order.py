@@ -0,0 +1,59 @@
+"""
+Compare the record-wise (`enforce_order_and_object()`) and column-wise
+(`enforce_order_and_object_columns()`) strategies for making structured
+arrays pandas-compatible, across a few table shapes. Not collected by pytest;
+run with `python -m pdr.tests.benchmark_enforce_order`.
+"""
+from timeit import repeat
+
+import numpy as np
+import pandas as pd
+
+from pdr.np_utils import (
+    enforce_order_and_object,
+    enforce_order_and_object_columns,
+)
+
+# (description, n_rows, field dtypes)
+SHAPES = (
+    ("narrow, all big-endian", 1_000_000, [">f8"] * 4),
+    ("narrow, mixed", 1_000_000, [">i4", "<f8", "V4", "<i2"]),
+    ("wide, all big-endian", 100_000, [">f4"] * 200),
+    ("wide, few big-endian", 100_000, [">i2"] * 5 + ["<f8"] * 195),
+    ("wide, all native", 100_000, ["<f8"] * 200),
+    ("tall, single field", 5_000_000, [">f8", "<i1"]),
+)
+
+
+def _records(n_rows, dtypes):
+    dtype = np.dtype([(f"F{ix}", dt) for ix, dt in enumerate(dtypes)])
+    rng = np.random.default_rng(0)
+    buffer = rng.integers(0, 255, n_rows * dtype.itemsize, dtype=np.uint8)
+    return np.frombuffer(buffer.tobytes(), dtype=dtype)
+
+
+def _by_record(array):
+    return pd.DataFrame.from_records(enforce_order_and_object(array))
+
+
+def _by_column(array):
+    return pd.DataFrame(enforce_order_and_object_columns(array), copy=False)
+
+
+def main(number=3, repeats=3):
+    print(f"{'shape':<24}{'records':>12}{'columns':>12}{'speedup':>10}")
+    for description, n_rows, dtypes in SHAPES:
+        array = _records(n_rows, dtypes)
+        times = [
+            min(repeat(lambda: func(array), number=number, repeat=repeats))
+            / number
+            for func in (_by_record, _by_column)
+        ]
+        print(
+            f"{description:<24}{times[0]:>11.4f}s{times[1]:>11.4f}s"
+            f"{times[0] / times[1]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,13 @@ from dustgoggles.tracker import Tracker
 from pdr.tests.objects import (
     STUB_IMAGE_LABEL,
     STUB_BINARY_TABLE_LABEL,
+    STUB_DSV_STREAM_LABEL,
     STUB_DSV_TABLE_LABEL,
+    STUB_FWF_TABLE_LABEL,
+    STUB_PDS4_ARRAY_LABEL,
+    STUB_PDS4_BINARY_TABLE_LABEL,
+    STUB_PDS4_DELIMITED_TABLE_LABEL,
+    STUB_PDS4_REPEATED_FIELD_TABLE_LABEL,
 )
 
 
@@ -29,6 +35,7 @@ def make_product(
     name: str,
     content: Union[np.ndarray, bytes, str],
     label: str,
+    label_suffix: str = ".LBL",
     **extra_label_params: Union[str, int]
 ):
     if isinstance(content, np.ndarray):
@@ -42,7 +49,7 @@ def make_product(
     label = label.format(product_name=name, **extra_label_params)
 
     fpath = dir / (name + ".QQQ")
-    lpath = dir / (name + ".LBL")
+    lpath = dir / (name + label_suffix)
 
     with fpath.open(mode) as stream:
         stream.write(content)
@@ -88,3 +95,87 @@ def dsv_table_product(products_dir):
     return make_product(
         products_dir, "DSV-TBL-PROD", table, STUB_DSV_TABLE_LABEL
     )
+
+
+@pytest.fixture(scope="session")
+def fwf_table_product(products_dir):
+    table = "".join(
+        f"{i:4d} \"{'dog' if i % 2 else 'cat'}\" {i * 1.25:6.2f}\r\n"
+        for i in range(10)
+    )
+    return make_product(
+        products_dir, "FWF-TBL-PROD", table, STUB_FWF_TABLE_LABEL
+    )
+
+
+@pytest.fixture(scope="session")
+def dsv_stream_product(products_dir):
+    table = "".join(f"{i},{i / 4}\n" for i in range(10)) + "END\n"
+    return make_product(
+        products_dir, "DSV-STREAM-PROD", table, STUB_DSV_STREAM_LABEL
+    )
+
+
+@pytest.fixture(scope="session")
+def pds4_array_product(products_dir):
+    image = np.arange(12, dtype=">i2").reshape(3, 4)
+    return make_product(
+        products_dir,
+        "PDS4-ARRAY-PROD",
+        image,
+        STUB_PDS4_ARRAY_LABEL,
+        label_suffix=".xml",
+        lines=3,
+        samples=4
+    )
+
+
+@pytest.fixture(scope="session")
+def pds4_binary_table_product(products_dir):
+    dt = np.dtype([("TIME", ">f8"), ("FLAG", "S2"), ("COUNTS", ">i2", (3,))])
+    table = np.zeros(5, dtype=dt)
+    table["TIME"] = np.arange(5) * 1.5
+    table["FLAG"] = [b"OK", b"NO", b"OK", b"NO", b"OK"]
+    table["COUNTS"] = np.arange(15).reshape(5, 3) - 7
+    return make_product(
+        products_dir,
+        "PDS4-BINARY-TABLE-PROD",
+        table,
+        STUB_PDS4_BINARY_TABLE_LABEL,
+        label_suffix=".xml",
+        records=5
+    )
+
+
+@pytest.fixture(scope="session")
+def pds4_repeated_field_table_product(products_dir):
+    dt = np.dtype([("TIME", ">f8"), ("C1", ">i2", (3,)), ("C2", ">i2", (3,))])
+    table = np.zeros(5, dtype=dt)
+    table["TIME"] = np.arange(5) * 1.5
+    table["C1"] = np.arange(15).reshape(5, 3)
+    table["C2"] = -table["C1"]
+    return make_product(
+        products_dir,
+        "PDS4-REPEATED-FIELD-TABLE-PROD",
+        table,
+        STUB_PDS4_REPEATED_FIELD_TABLE_LABEL,
+        label_suffix=".xml",
+        records=5
+    )
+
+
+@pytest.fixture(scope="session")
+def pds4_delimited_table_product(products_dir):
+    names = [f'"a,{i}"' if i % 3 == 0 else f"b{i}" for i in range(40)]
+    values = ["" if i == 7 else str(i / 4) for i in range(40)]
+    text = "".join(
+        f"{i},{names[i]},{values[i]},{i * 2},{-i}\r\n" for i in range(40)
+    )
+    return make_product(
+        products_dir,
+        "PDS4-DELIMITED-TABLE-PROD",
+        text,
+        STUB_PDS4_DELIMITED_TABLE_LABEL,
+        label_suffix=".xml",
+        records=40
+    )
@@ -69,6 +69,57 @@ END_OBJECT                  = TABLE
 END
 """
 
+STUB_DSV_STREAM_LABEL = """
+^SPREADSHEET          = "{product_name}.QQQ"
+RECORD_TYPE     = STREAM
+OBJECT           = SPREADSHEET
+    INTERCHANGE_FORMAT      = ASCII
+    ROWS                    = 10
+    FIELD_DELIMITER         = COMMA
+    COLUMNS                 = 2
+    OBJECT                  = COLUMN
+        NAME                = "X"
+        DATA_TYPE           = "ASCII_INTEGER"
+    END_OBJECT              = COLUMN
+    OBJECT                  = COLUMN
+        NAME                = "Y"
+        DATA_TYPE           = "ASCII_REAL"
+    END_OBJECT              = COLUMN
+END_OBJECT                  = SPREADSHEET
+END
+"""
+
+STUB_FWF_TABLE_LABEL = """
+^TABLE          = "{product_name}.QQQ"
+RECORD_TYPE     = FIXED_LENGTH
+FILE_RECORDS    = 10
+RECORD_BYTES    = 19
+OBJECT           = TABLE
+    INTERCHANGE_FORMAT      = ASCII
+    ROWS                    = 10
+    ROW_BYTES               = 19
+    COLUMNS                 = 3
+    OBJECT                  = COLUMN
+        NAME                = "X"
+        DATA_TYPE           = "ASCII_INTEGER"
+        START_BYTE          = 1
+        BYTES               = 4
+    END_OBJECT              = COLUMN
+    OBJECT                  = COLUMN
+        NAME                = "Y"
+        DATA_TYPE           = "CHARACTER"
+        START_BYTE          = 6
+        BYTES               = 5
+    END_OBJECT              = COLUMN
+    OBJECT                  = COLUMN
+        NAME                = "Z"
+        DATA_TYPE           = "ASCII_REAL"
+        START_BYTE          = 12
+        BYTES               = 6
+    END_OBJECT              = COLUMN
+END_OBJECT                  = TABLE
+END
+"""
 
 STUB_IMAGE_LABEL = """
 ^IMAGE = "{product_name}.QQQ"
@@ -90,6 +141,18 @@ END_OBJECT       = IMAGE
 END
 """
 
+STUB_VAX_IMAGE_LABEL = """
+^IMAGE = "{product_name}.QQQ"
+OBJECT       = IMAGE
+    INTERCHANGE_FORMAT              = BINARY
+    LINES                           = 2
+    LINE_SAMPLES                    = 3
+    SAMPLE_TYPE                     = {sample_type}
+    SAMPLE_BITS                     = {sample_bits}
+END_OBJECT       = IMAGE
+END
+"""
+
 SILLY_LABEL = """
 PDS_VERSION_ID                    = NO
 /* FILE DATA ELEMENTS */
@@ -175,3 +238,221 @@ MINIMAL_PDS4_LABEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
   <Reference_List></Reference_List>
   <File_Area_Observational></File_Area_Observational>
 </Product_Observational>"""
+
+STUB_PDS4_ARRAY_LABEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<Product_Observational xmlns="http://pds.nasa.gov/pds4/pds/v1">
+  <Identification_Area>
+    <logical_identifier>urn:nasa:pds:mc_pdr_testsuite:test_products:{product_name}</logical_identifier>
+    <version_id>1.0</version_id>
+    <title>{product_name}</title>
+    <information_model_version>1.16.0.0</information_model_version>
+    <product_class>Product_Observational</product_class>
+  </Identification_Area>
+  <File_Area_Observational>
+    <File>
+      <file_name>{product_name}.QQQ</file_name>
+    </File>
+    <Array_2D_Image>
+      <local_identifier>IMAGE</local_identifier>
+      <offset unit="byte">0</offset>
+      <axes>2</axes>
+      <axis_index_order>Last Index Fastest</axis_index_order>
+      <Element_Array>
+        <data_type>SignedMSB2</data_type>
+      </Element_Array>
+      <Axis_Array>
+        <axis_name>Line</axis_name>
+        <elements>{lines}</elements>
+        <sequence_number>1</sequence_number>
+      </Axis_Array>
+      <Axis_Array>
+        <axis_name>Sample</axis_name>
+        <elements>{samples}</elements>
+        <sequence_number>2</sequence_number>
+      </Axis_Array>
+    </Array_2D_Image>
+  </File_Area_Observational>
+</Product_Observational>
+"""
+
+STUB_PDS4_BINARY_TABLE_LABEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<Product_Observational xmlns="http://pds.nasa.gov/pds4/pds/v1">
+  <Identification_Area>
+    <logical_identifier>urn:nasa:pds:mc_pdr_testsuite:test_products:{product_name}</logical_identifier>
+    <version_id>1.0</version_id>
+    <title>{product_name}</title>
+    <information_model_version>1.16.0.0</information_model_version>
+    <product_class>Product_Observational</product_class>
+  </Identification_Area>
+  <File_Area_Observational>
+    <File>
+      <file_name>{product_name}.QQQ</file_name>
+    </File>
+    <Table_Binary>
+      <local_identifier>TABLE</local_identifier>
+      <offset unit="byte">0</offset>
+      <records>{records}</records>
+      <Record_Binary>
+        <fields>2</fields>
+        <groups>1</groups>
+        <record_length unit="byte">16</record_length>
+        <Field_Binary>
+          <name>TIME</name>
+          <field_number>1</field_number>
+          <field_location unit="byte">1</field_location>
+          <data_type>IEEE754MSBDouble</data_type>
+          <field_length unit="byte">8</field_length>
+        </Field_Binary>
+        <Field_Binary>
+          <name>FLAG</name>
+          <field_number>2</field_number>
+          <field_location unit="byte">9</field_location>
+          <data_type>ASCII_String</data_type>
+          <field_length unit="byte">2</field_length>
+        </Field_Binary>
+        <Group_Field_Binary>
+          <group_number>1</group_number>
+          <repetitions>3</repetitions>
+          <fields>1</fields>
+          <groups>0</groups>
+          <group_location unit="byte">11</group_location>
+          <group_length unit="byte">6</group_length>
+          <Field_Binary>
+            <name>COUNTS</name>
+            <field_number>1</field_number>
+            <field_location unit="byte">1</field_location>
+            <data_type>SignedMSB2</data_type>
+            <field_length unit="byte">2</field_length>
+          </Field_Binary>
+        </Group_Field_Binary>
+      </Record_Binary>
+    </Table_Binary>
+  </File_Area_Observational>
+</Product_Observational>
+"""
+
+STUB_PDS4_REPEATED_FIELD_TABLE_LABEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<Product_Observational xmlns="http://pds.nasa.gov/pds4/pds/v1">
+  <Identification_Area>
+    <logical_identifier>urn:nasa:pds:mc_pdr_testsuite:test_products:{product_name}</logical_identifier>
+    <version_id>1.0</version_id>
+    <title>{product_name}</title>
+    <information_model_version>1.16.0.0</information_model_version>
+    <product_class>Product_Observational</product_class>
+  </Identification_Area>
+  <File_Area_Observational>
+    <File>
+      <file_name>{product_name}.QQQ</file_name>
+    </File>
+    <Table_Binary>
+      <local_identifier>TABLE</local_identifier>
+      <offset unit="byte">0</offset>
+      <records>{records}</records>
+      <Record_Binary>
+        <fields>1</fields>
+        <groups>2</groups>
+        <record_length unit="byte">20</record_length>
+        <Field_Binary>
+          <name>TIME</name>
+          <field_number>1</field_number>
+          <field_location unit="byte">1</field_location>
+          <data_type>IEEE754MSBDouble</data_type>
+          <field_length unit="byte">8</field_length>
+        </Field_Binary>
+        <Group_Field_Binary>
+          <group_number>1</group_number>
+          <repetitions>3</repetitions>
+          <fields>1</fields>
+          <groups>0</groups>
+          <group_location unit="byte">9</group_location>
+          <group_length unit="byte">6</group_length>
+          <Field_Binary>
+            <name>COUNTS</name>
+            <field_number>1</field_number>
+            <field_location unit="byte">1</field_location>
+            <data_type>SignedMSB2</data_type>
+            <field_length unit="byte">2</field_length>
+          </Field_Binary>
+        </Group_Field_Binary>
+        <Group_Field_Binary>
+          <group_number>2</group_number>
+          <repetitions>3</repetitions>
+          <fields>1</fields>
+          <groups>0</groups>
+          <group_location unit="byte">15</group_location>
+          <group_length unit="byte">6</group_length>
+          <Field_Binary>
+            <name>COUNTS</name>
+            <field_number>1</field_number>
+            <field_location unit="byte">1</field_location>
+            <data_type>SignedMSB2</data_type>
+            <field_length unit="byte">2</field_length>
+          </Field_Binary>
+        </Group_Field_Binary>
+      </Record_Binary>
+      <Uniformly_Sampled>
+        <sampling_parameter_name>STEP</sampling_parameter_name>
+        <sampling_parameter_interval>0.5</sampling_parameter_interval>
+        <first_sampling_parameter_value>1</first_sampling_parameter_value>
+        <last_sampling_parameter_value>3</last_sampling_parameter_value>
+        <sampling_parameter_scale>Linear</sampling_parameter_scale>
+      </Uniformly_Sampled>
+    </Table_Binary>
+  </File_Area_Observational>
+</Product_Observational>
+"""
+
+STUB_PDS4_DELIMITED_TABLE_LABEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<Product_Observational xmlns="http://pds.nasa.gov/pds4/pds/v1">
+  <Identification_Area>
+    <logical_identifier>urn:nasa:pds:mc_pdr_testsuite:test_products:{product_name}</logical_identifier>
+    <version_id>1.0</version_id>
+    <title>{product_name}</title>
+    <information_model_version>1.16.0.0</information_model_version>
+    <product_class>Product_Observational</product_class>
+  </Identification_Area>
+  <File_Area_Observational>
+    <File>
+      <file_name>{product_name}.QQQ</file_name>
+    </File>
+    <Table_Delimited>
+      <local_identifier>TABLE</local_identifier>
+      <offset unit="byte">0</offset>
+      <parsing_standard_id>PDS DSV 1</parsing_standard_id>
+      <records>{records}</records>
+      <record_delimiter>Carriage-Return Line-Feed</record_delimiter>
+      <field_delimiter>Comma</field_delimiter>
+      <Record_Delimited>
+        <fields>3</fields>
+        <groups>1</groups>
+        <Field_Delimited>
+          <name>INDEX</name>
+          <field_number>1</field_number>
+          <data_type>ASCII_Integer</data_type>
+        </Field_Delimited>
+        <Field_Delimited>
+          <name>NAME</name>
+          <field_number>2</field_number>
+          <data_type>ASCII_String</data_type>
+        </Field_Delimited>
+        <Field_Delimited>
+          <name>VALUE</name>
+          <field_number>3</field_number>
+          <data_type>ASCII_Real</data_type>
+        </Field_Delimited>
+        <Group_Field_Delimited>
+          <group_number>1</group_number>
+          <repetitions>2</repetitions>
+          <fields>1</fields>
+          <groups>0</groups>
+          <Field_Delimited>
+            <name>COUNTS</name>
+            <field_number>1</field_number>
+            <data_type>ASCII_Integer</data_type>
+          </Field_Delimited>
+        </Group_Field_Delimited>
+      </Record_Delimited>
+    </Table_Delimited>
+  </File_Area_Observational>
+</Product_Observational>
+"""
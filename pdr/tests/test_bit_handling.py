@@ -58,3 +58,21 @@ def test_bit_handling():
     assert strings[1] == ''.join(map(str, bits[4:7]))
     assert strings[2] == "".join(map(str, bits[8:12]))
     assert strings[3] == "".join(map(str, bits[12:16]))
+
+
+def test_bit_handling_as_integers():
+    block = parse_pvl(BIT_STUB)[0]
+    fmtdef = read_table_structure(block, 'TABLE', None, None, NULL_IDENTIFIERS)
+    bits = random.choices((0, 1), k=16)
+    table = pd.DataFrame(
+        {'BITS1': [int("".join(map(str, bits)), 2).to_bytes(2, 'big')]}
+    )
+    table = expand_bit_strings(table, fmtdef, as_integers=True)
+    assert list(table.columns) == [
+        'BITS1_BITS2_0', 'BITS1_BITS2_1', 'BITS1_BITS3_2', 'BITS1_BITS4_3'
+    ]
+    assert table.iloc[0, 0] == int(''.join(map(str, bits[0:3])), 2)
+    assert table.iloc[0, 1] == int(''.join(map(str, bits[4:7])), 2)
+    assert table.iloc[0, 2] == int("".join(map(str, bits[8:12])), 2)
+    assert table.iloc[0, 3] == int("".join(map(str, bits[12:16])), 2)
+    assert table.dtypes.iloc[0] == 'uint8'
@@ -13,6 +13,7 @@ from pdr.browsify import (
     colorfill_maskedarray,
     browsify,
 )
+from pdr.pd_utils import WideTable
 
 import pytest
 try:
@@ -76,6 +77,14 @@ def test_browsify_df(tmp_path):
     assert (df["b"] == ["cat", "dog"]).all()
 
 
+def test_browsify_wide_table(tmp_path):
+    obj = WideTable([(["a", "b"], np.array([[1, 2], [3, 4]]))])
+    browsify(obj, tmp_path / "browse")
+    df = pd.read_csv(tmp_path / "browse.csv")
+    assert (df["a"] == [1, 3]).all()
+    assert (df["b"] == [2, 4]).all()
+
+
 @pytest.mark.skipif(not pil_available, reason="PIL not available")
 def test_browsify_array(tmp_path):
     arr = np.ma.masked_outside(RNG.poisson(100, (1024, 1024)), 10, 90)
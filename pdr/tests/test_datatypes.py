@@ -74,3 +74,32 @@ def test_sample_types():
         "S8",
     ]
     assert numpy_dtype_strings == expected_dtype_strings
+
+
+def test_pds4_ascii_table_conversion():
+    import numpy as np
+
+    from pdr.pds4_tools.reader.data_types import (
+        data_type_convert_table_ascii
+    )
+
+    values = np.array([b" 12", b"   ", b"-3 ", b"+4"])
+    ints = data_type_convert_table_ascii(
+        "ASCII_Integer", values, mask_nulls=True
+    )
+    assert ints.dtype == np.int64
+    assert ints.mask.tolist() == [False, True, False, False]
+    assert ints.filled(99).tolist() == [12, 99, -3, 4]
+    reals = data_type_convert_table_ascii(
+        "ASCII_Real", np.array([b" 1.5", b"1e3"])
+    )
+    assert reals.tolist() == [1.5, 1000.0]
+    bools = data_type_convert_table_ascii(
+        "ASCII_Boolean", np.array([b"true", b"0", b" false", b"1"])
+    )
+    assert bools.tolist() == [True, False, False, True]
+    # values that cannot be converted in bulk use the general conversion
+    hexes = data_type_convert_table_ascii(
+        "ASCII_Numeric_Base16", np.array([b"ff", b"10"])
+    )
+    assert hexes.tolist() == [255, 16]
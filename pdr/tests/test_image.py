@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import pdr
 
 
@@ -13,3 +15,86 @@ def test_image_simple_3d(multiband_image_product, tracker_factory):
     prod_name, fpath, lpath = multiband_image_product
     data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
     assert data.IMAGE.sum() == 0
+
+
+def test_pds4_array_memmap(pds4_array_product):
+    import numpy as np
+
+    prod_name, fpath, lpath = pds4_array_product
+    data = pdr.read(lpath)
+    data.load("IMAGE", memmap=True)
+    base = data.IMAGE
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+    assert data.IMAGE.shape == (3, 4)
+    assert (data.IMAGE == np.arange(12).reshape(3, 4)).all()
+    assert (pdr.read(lpath).IMAGE == data.IMAGE).all()
+
+
+@pytest.mark.parametrize(
+    "sample_type, sample_bits, dtype, raw",
+    [
+        # VAX F-floating 1, -0.5, 0
+        (
+            "VAX_REAL",
+            32,
+            "float32",
+            (b"\x80\x40\0\0", b"\x00\xc0\0\0", b"\0" * 4),
+        ),
+        # VAX D-floating
+        (
+            "VAX_DOUBLE",
+            64,
+            "float64",
+            (b"\x80\x40" + b"\0" * 6, b"\x00\xc0" + b"\0" * 6, b"\0" * 8),
+        ),
+        # VAX G-floating
+        (
+            "VAXG_REAL",
+            64,
+            "float64",
+            (b"\x10\x40" + b"\0" * 6, b"\x00\xc0" + b"\0" * 6, b"\0" * 8),
+        ),
+    ],
+)
+def test_vax_image(sample_type, sample_bits, dtype, raw, tmp_path):
+    import numpy as np
+
+    from pdr.tests.conftest import make_product
+    from pdr.tests.objects import STUB_VAX_IMAGE_LABEL
+
+    prod_name, fpath, lpath = make_product(
+        tmp_path,
+        f"VAX-IMG-{sample_type}",
+        b"".join(raw * 2),
+        STUB_VAX_IMAGE_LABEL,
+        sample_type=sample_type,
+        sample_bits=sample_bits,
+    )
+    image = pdr.read(lpath).IMAGE
+    assert image.dtype == np.dtype(dtype)
+    assert (image == np.array([[1, -0.5, 0], [1, -0.5, 0]])).all()
+
+
+def test_vax_image_special_values(tmp_path):
+    import numpy as np
+
+    from pdr.tests.conftest import make_product
+    from pdr.tests.objects import STUB_VAX_IMAGE_LABEL
+
+    # exponent-0 values are zero (even with nonzero mantissa bits) or, with
+    # the sign bit set, reserved operands; the largest F value is finite
+    raw = (b"\x01\x00\0\0", b"\x00\x80\0\0", b"\xff\x7f\xff\xff")
+    prod_name, fpath, lpath = make_product(
+        tmp_path,
+        "VAX-IMG-SPECIAL",
+        b"".join(raw * 2),
+        STUB_VAX_IMAGE_LABEL,
+        sample_type="VAX_REAL",
+        sample_bits=32,
+    )
+    image = pdr.read(lpath).IMAGE
+    assert (image[:, 0] == 0).all()
+    assert np.isnan(image[:, 1]).all()
+    assert (image[:, 2] == np.float32(1.7014117e38)).all()
@@ -11,7 +11,9 @@ from pdr.np_utils import (
     np_from_buffered_io,
     ibm32_to_np_f32,
     ibm64_to_np_f64,
+    vax_to_np,
     enforce_order_and_object,
+    enforce_order_and_object_columns,
 )
 
 RNG = np.random.default_rng()
@@ -61,6 +63,23 @@ def test_enforce_order_and_object():
     assert enforced4.dtype == np.dtype("i2")
 
 
+def test_enforce_order_and_object_columns():
+    gross = np.dtype([("f1", "V4"), ("f2", "i2"), ("f3", ">i2")])
+    grossarray = np.array([(b"\x00\x00\x00\x01", 12, 12)] * 3, dtype=gross)
+    columns = enforce_order_and_object_columns(grossarray)
+    assert list(columns) == ["f1", "f2", "f3"]
+    assert columns["f1"].dtype == np.dtype("O")
+    assert columns["f1"][0] == b"\x00\x00\x00\x01"
+    assert columns["f3"].dtype == np.dtype("i2")
+    assert list(columns["f3"]) == [12, 12, 12]
+    # native fields are views, not copies
+    assert np.shares_memory(columns["f2"], grossarray)
+    assert not np.shares_memory(columns["f3"], grossarray)
+    records = enforce_order_and_object(grossarray)
+    for name, column in columns.items():
+        assert np.all(records[name] == column)
+
+
 def test_ibm_to_np():
     assert ibm32_to_np_f32(np.frombuffer(b"\x00\x00\x01\xc2", "i4")) == -1
     assert (
@@ -69,3 +88,52 @@ def test_ibm_to_np():
         )
         == -1
     )
+    ibm = np.array(
+        [0x42640000, 0xC2640000, 0x00000000, 0x3B000007, 0x7FFFFFFF],
+        dtype=">u4",
+    )
+    f64 = ibm32_to_np_f32(ibm)
+    assert f64.dtype == np.dtype("f8")
+    assert list(f64[:3]) == [100, -100, 0]
+    assert f64[3] == 7 * 2.0 ** -44
+    assert f64[4] == (1 - 2.0 ** -24) * 16.0 ** 63
+    with np.errstate(over="ignore"):
+        f32 = ibm32_to_np_f32(ibm, np.float32)
+    assert f32.dtype == np.dtype("f4")
+    assert np.array_equal(f32[:4], f64[:4].astype(np.float32))
+    assert np.isinf(f32[4])
+
+
+def test_vax_to_np():
+    # F-floating: 1, -0.5, largest value, smallest value, 0, reserved operand
+    vax_f = np.frombuffer(
+        b"\x80\x40\0\0" b"\x00\xc0\0\0" b"\xff\x7f\xff\xff"
+        b"\x80\x00\0\0" b"\x00\x00\x12\x34" b"\x00\x80\0\0",
+        dtype="<u4",
+    ).reshape(2, 3)
+    f = vax_to_np(vax_f)
+    assert f.dtype == np.dtype("f4") and f.shape == (2, 3)
+    assert list(f.ravel()[:2]) == [1, -0.5]
+    assert f.ravel()[2] == np.float32((1 - 2.0 ** -24) * 2.0 ** 127)
+    assert f.ravel()[3] == np.float32(2.0 ** -128)
+    assert f.ravel()[4] == 0
+    assert np.isnan(f.ravel()[5])
+    # D-floating and G-floating: 1, -0.5, 0
+    vax_d = np.frombuffer(
+        b"\x80\x40" + b"\0" * 6 + b"\x00\xc0" + b"\0" * 6 + b"\0" * 8,
+        dtype="<u8",
+    )
+    assert list(vax_to_np(vax_d, "D")) == [1, -0.5, 0]
+    vax_g = np.frombuffer(
+        b"\x10\x40" + b"\0" * 6 + b"\x00\xc0" + b"\0" * 6 + b"\0" * 8,
+        dtype="<u8",
+    )
+    assert list(vax_to_np(vax_g, "G")) == [1, -0.5, 0]
+    # D-floating has 3 more bits of mantissa than IEEE doubles; these are
+    # rounded off, half to even
+    d_pi = np.frombuffer(b"\x49\x41\xda\x0f\x21\xa2\xc0\x68", dtype="<u8")
+    assert vax_to_np(d_pi, "D")[0] == np.pi
+    d_ties = np.frombuffer(
+        b"\x80\x40\0\0\0\0\x04\0" b"\x80\x40\0\0\0\0\x0c\0", dtype="<u8"
+    )
+    assert list(vax_to_np(d_ties, "D")) == [1, 1 + 2.0 ** -51]
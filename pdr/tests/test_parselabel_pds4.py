@@ -32,3 +32,38 @@ def test_parse_label(tmp_path):
 
     IA = PO["Identification_Area"]
     assert IA["logical_identifier"] == "urn:nasa:pds:mc_pdr_testsuite:test_labels:test_minimal_label.dat"
+
+
+def test_reformat_matches_to_dict(tmp_path):
+    from collections import OrderedDict
+
+    from dustgoggles.func import constant
+    from dustgoggles.structures import dig_for_keys
+    from multidict import MultiDict
+
+    from pdr.parselabel.pds4 import unpack_to_multidict
+    from pdr.tests.objects import STUB_PDS4_BINARY_TABLE_LABEL
+
+    def as_lists(value):
+        if isinstance(value, MultiDict):
+            return [(k, as_lists(v)) for k, v in value.items()]
+        return value
+
+    label_f = tmp_path / "table_pds4.xml"
+    with open(label_f, "wt") as fp:
+        # repeated, interleaved and namespaced elements, attributes
+        fp.write(
+            STUB_PDS4_BINARY_TABLE_LABEL.format(
+                product_name="table", records=5
+            ).replace(
+                "<title>",
+                '<foo:x xmlns:foo="urn:foo" foo:a="1"/><title>'
+            )
+        )
+    label = Label.from_file(label_f)
+    expected = unpack_to_multidict(label.to_dict(), (OrderedDict, MultiDict))
+    unpacked, params = reformat_pds4_tools_label(label)
+    assert as_lists(unpacked) == as_lists(expected)
+    assert params == dig_for_keys(
+        expected, None, base_pred=constant(True), mtypes=(MultiDict,)
+    )
@@ -24,6 +24,7 @@ def test_generic_properties():
     assert props == {
         "BYTES_PER_PIXEL": 4,
         "is_vax_real": False,
+        "vax_format": None,
         "sample_type": ">f",
         "nrows": 650,
         "ncols": 350,
@@ -54,6 +55,7 @@ def test_qube_props():
         "bandpad": 8,
         "suffix_bands": 8,
         "linepad": 0,
+        "vax_format": None,
         "is_vax_real": False,
     }
     assert extract_axplane_metadata(qube_block, props) == {
@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 
 import pdr
-from pdr._scaling import find_special_constants
+from pdr._scaling import (
+    find_special_constants, scale_array, scale_chunked, scan_array
+)
 from pdr.parselabel.pds3 import parse_pvl
 
 RNG = np.random.default_rng()
@@ -21,3 +23,55 @@ def test_find_special_constants():
     arr = RNG.choice(np.array([33, -32766, 100]), (100, 100))
     specials = find_special_constants(meta, arr.astype(np.int16), 'IMAGE')
     assert specials == {"INVALID_CONSTANT": 33, "ISIS_LOW_INST_SAT": -32766}
+
+
+def test_scan_array():
+    arr = RNG.uniform(-10, 10, 10000).astype(np.float32)
+    arr[9000] = -32766
+    arr[-1] = np.inf
+    candidates = {"A": -32766, "B": 32767, "C": 5.5}
+    scan = scan_array(arr, candidates, True, 128)
+    assert (scan.present, scan.nonfinite) == ({"A"}, True)
+    assert (scan.low, scan.high) == (-32766, arr[:-1].max())
+    scan = scan_array(arr[:5000], candidates, True)
+    assert (scan.present, scan.nonfinite) == (set(), False)
+
+
+def test_integer_scaling_dtype():
+    meta = pdr.Metadata(
+        parse_pvl(STUB.replace("33", "33\n    SCALING_FACTOR = 3")), 'PDS3'
+    )
+    arr = np.array([[0, 33], [-100, 30000]], dtype=np.int16)
+    scaled = scale_array(meta, arr, "IMAGE", specials=[33])
+    assert scaled.dtype == np.dtype("int32")
+    assert scaled[1, 1] == 90000
+    assert scaled.mask.sum() == 1
+    small = np.array([0, 33, -100], dtype=np.int16)
+    assert scale_array(meta, small, "IMAGE", inplace=True) is small
+
+
+def test_scale_chunked():
+    arr = RNG.choice(np.array([33, -32766, 100]), (3, 50, 50))
+    arr = arr.astype(np.int16)
+    out = np.empty(arr.shape, dtype=np.float32)
+    scaled = scale_chunked(arr, 0.5, 2, out, [33], chunk_elements=100)
+    assert np.shares_memory(scaled.data, out)
+    assert (scaled.mask == (arr == 33)).all()
+    assert np.allclose(scaled.data[~scaled.mask], (arr * 0.5 + 2)[arr != 33])
+    # masked elements keep their unscaled sentinel values
+    assert (scaled.data[scaled.mask] == 33).all()
+    # per-band scaling in place
+    farr = arr.astype(np.float64)
+    farr[0, 0, 0] = np.nan
+    expected = farr * np.array([1, 2, 3])[:, None, None] - 1
+    scaled = scale_chunked(
+        farr, [1, 2, 3], [-1, -1, -1], farr, [np.nan], chunk_elements=77
+    )
+    assert np.shares_memory(scaled.data, farr)
+    assert scaled.mask.sum() == 1
+    assert np.allclose(scaled.data, expected, equal_nan=True)
+    arr = np.array([[1, 33], [33, 4]], dtype=np.int16)
+    scaled = scale_chunked(
+        arr.copy(), [2, 3], [1, 1], np.empty(arr.shape), [33]
+    )
+    assert scaled.data.tolist() == [[3, 33], [33, 13]]
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+from io import StringIO
+from types import MappingProxyType
+
 import numpy as np
 import pandas as pd
+import pytest
 
 import pdr
+from pdr.datatypes import sample_types
+from pdr.loaders import table as table_module
+from pdr.loaders.table import PAD_CHARACTERS, read_fixed_width_records
+from pdr.pd_utils import (
+    columns_from_plan,
+    compile_column_plan,
+    decode_ebcdic,
+    scale_table_columns,
+    structured_array_to_df,
+    wide_table_from_records,
+    LazyTable,
+    WideTable,
+)
 
 
 def test_simple_binary_table(binary_table_product, tracker_factory):
@@ -18,6 +35,211 @@ def test_simple_binary_table(binary_table_product, tracker_factory):
     assert np.isclose(data.TABLE.loc[9, "X_1"], 8.8)
 
 
+def test_iter_binary_table(binary_table_product, tracker_factory):
+    prod_name, fpath, lpath = binary_table_product
+    data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+    chunks = list(data.iter_table("TABLE", chunk_rows=3))
+    assert [len(c) for c in chunks] == [3, 3, 3, 1]
+    assert "TABLE" not in dir(data)
+    assert pd.concat(chunks).equals(data.TABLE)
+    chunks = list(data.iter_table("TABLE", chunk_rows=4, columns=["Y"]))
+    assert list(chunks[-1].columns) == ["Y"]
+    assert list(chunks[-1].index) == [8, 9]
+
+
+def test_wide_binary_table(binary_table_product, tracker_factory):
+    prod_name, fpath, lpath = binary_table_product
+    data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+    data.load("TABLE", wide_table=True)
+    assert isinstance(data.TABLE, WideTable)
+    assert data.TABLE.columns == ['X_0', 'Y', 'X_1']
+    assert data.TABLE.shape == (10, 3)
+    assert np.isclose(data.TABLE["Y"], 4.4).all()
+    assert data.TABLE.to_dataframe().equals(
+        pdr.read(fpath).TABLE
+    )
+
+
+def test_wide_table_from_records():
+    names = [f"C{ix}" for ix in range(6)]
+    fmtdef = pd.DataFrame(
+        {
+            "NAME": names + ["D"],
+            "DATA_TYPE": ["MSB_INTEGER"] * 4 + ["IEEE_REAL"] * 2 + ["EBCDIC"],
+            "SCALING_FACTOR": [None, None, 2, 2, None, None, None],
+        }
+    )
+    dt = np.dtype(
+        [(n, ">i2") for n in names[:4]]
+        + [(n, ">f4") for n in names[4:]]
+        + [("D", "V1")]
+    )
+    array = np.zeros(2, dtype=dt)
+    for ix, name in enumerate(names):
+        array[name] = ix
+    array["D"] = np.frombuffer(b"\xc1" * 2, dtype="V1")
+    records = array.view(np.uint8).reshape(2, dt.itemsize)
+    table = wide_table_from_records(
+        records, dt, compile_column_plan(fmtdef, dt)
+    )
+    # unscaled ints, scaled ints, floats, EBCDIC text
+    assert [names for names, _ in table.blocks] == [
+        names[:2], names[2:4], names[4:], ["D"]
+    ]
+    assert list(table["C3"]) == [6, 6]
+    assert table["C5"].dtype == np.dtype("float32")
+    assert list(table["D"]) == ["A", "A"]
+    assert table.to_dataframe().equals(
+        columns_from_plan(array, compile_column_plan(fmtdef, dt))
+    )
+
+
+def test_decode_ebcdic():
+    raw = (
+        b"\xc8\x85\x93\x93\x96"
+        b"\xa6\x96\x99\x93\x84"
+        b"\xc1\x40\x40\x40\x00"
+    )
+    decoded = decode_ebcdic(np.frombuffer(raw, dtype="V5"))
+    assert list(decoded) == ["Hello", "world", "A   \x00"]
+    assert list(decode_ebcdic(np.frombuffer(raw[:10], dtype="V5"))) == [
+        "Hello", "world"
+    ]
+    assert list(decode_ebcdic(np.frombuffer(raw, dtype="S5"))) == [
+        "Hello", "world", "A   "
+    ]
+
+
+def test_columns_from_plan():
+    fmtdef = pd.DataFrame(
+        {
+            "NAME": ["A", "B", "C", "D", "PLACEHOLDER_0"],
+            "DATA_TYPE": [
+                "MSB_INTEGER", "IBM_REAL", "BOOLEAN", "EBCDIC", "VOID"
+            ],
+        }
+    )
+    dt = np.dtype(
+        [("A", ">i2"), ("B", ">u4"), ("C", "u1"), ("D", "V2"),
+         ("PLACEHOLDER_0", "V1")]
+    )
+    array = np.zeros(3, dtype=dt)
+    array["A"] = [1, -2, 3]
+    # IBM S/360 single-precision -1
+    array["B"] = int.from_bytes(b"\xc1\x10\x00\x00", "big")
+    array["C"] = [0, 1, 0]
+    array["D"] = np.frombuffer(b"\xc1\xc2" * 3, dtype="V2")
+    plan = compile_column_plan(fmtdef, dt)
+    assert plan is compile_column_plan(fmtdef, dt)
+    table = columns_from_plan(array, plan)
+    assert list(table.columns) == ["A", "B", "C", "D"]
+    assert table["A"].dtype == np.dtype("int16")
+    assert list(table["A"]) == [1, -2, 3]
+    assert (table["B"] == -1).all()
+    assert table["C"].dtype == np.dtype("bool")
+    assert (table["D"] == "AB").all()
+    fmtdef["SCALING_FACTOR"] = [0.5, np.nan, None, None, None]
+    fmtdef["OFFSET"] = [np.nan, 2, None, None, None]
+    table = columns_from_plan(array, compile_column_plan(fmtdef, dt))
+    assert list(table["A"]) == [0.5, -1, 1.5]
+    assert (table["B"] == 1).all()
+
+
+def test_scaling_does_not_modify_source():
+    fmtdef = pd.DataFrame(
+        {
+            "NAME": ["A"],
+            "DATA_TYPE": ["PC_REAL"],
+            "SCALING_FACTOR": [2],
+            "OFFSET": [1],
+        }
+    )
+    dt = np.dtype([("A", "<f8")])
+    array = np.ones(3, dtype=dt)
+    plan = compile_column_plan(fmtdef, dt)
+    assert list(columns_from_plan(array, plan)["A"]) == [3, 3, 3]
+    records = array.view(np.uint8).reshape(3, dt.itemsize)
+    assert list(wide_table_from_records(records, dt, plan)["A"]) == [3, 3, 3]
+    assert list(array["A"]) == [1, 1, 1]
+
+
+def test_vax_reals():
+    fmtdef = pd.DataFrame(
+        {
+            "NAME": ["F", "D", "D2", "G"],
+            "DATA_TYPE": ["VAX_REAL", "VAX_REAL", "VAX_DOUBLE", "VAXG_REAL"],
+            "BYTES": [4, 8, 8, 8],
+        }
+    )
+    dt = np.dtype(
+        [(n, sample_types(t, b, True)) for n, t, b in fmtdef.to_numpy()]
+    )
+    # 1, -0.5, and 0 in each format
+    raw = {
+        "F": (b"\x80\x40\0\0", b"\x00\xc0\0\0", b"\0" * 4),
+        "D": (b"\x80\x40" + b"\0" * 6, b"\x00\xc0" + b"\0" * 6, b"\0" * 8),
+        "G": (b"\x10\x40" + b"\0" * 6, b"\x00\xc0" + b"\0" * 6, b"\0" * 8),
+    }
+    array = np.zeros(3, dtype=dt)
+    for name in dt.names:
+        array[name] = np.frombuffer(b"".join(raw[name[0]]), dtype=dt[name])
+    plan = compile_column_plan(fmtdef, dt)
+    records = array.view(np.uint8).reshape(3, dt.itemsize)
+    wide = wide_table_from_records(records, dt, plan)
+    # adjacent D-floating columns are converted as one block
+    assert [names for names, _ in wide.blocks] == [["F"], ["D", "D2"], ["G"]]
+    table = columns_from_plan(array, plan)
+    assert table.equals(wide.to_dataframe())
+    assert table["F"].dtype == np.dtype("float32")
+    assert table["G"].dtype == np.dtype("float64")
+    for name in dt.names:
+        assert list(table[name]) == [1, -0.5, 0]
+
+
+def test_structured_array_to_df():
+    dt = np.dtype(
+        [
+            ("A", ">i4"),
+            ("B", "S3"),
+            ("C", "<f8", (2,)),
+            ("D", "V2"),
+            ("E", ">i2", (2, 3)),
+        ]
+    )
+    array = np.zeros(3, dtype=dt)
+    array["A"] = [1, 2, 3]
+    array["B"] = [b"x", b"yy", b""]
+    array["E"] = np.arange(18).reshape(3, 2, 3)
+    table = structured_array_to_df(array)
+    assert list(table.columns) == (
+        ["A", "B", "C_0", "C_1", "D"] + [f"E_{ix}" for ix in range(6)]
+    )
+    assert table["A"].dtype == np.dtype("int32")
+    assert list(table["A"]) == [1, 2, 3]
+    assert list(table["B"]) == [b"x", b"yy", b""]
+    assert table["D"].dtype == np.dtype("O")
+    assert list(table["E_4"]) == [4, 10, 16]
+    # masked nested elements are filled
+    masked = np.ma.masked_array(array)
+    masked.mask["E"][0, 1, 1] = True
+    assert np.isnan(structured_array_to_df(masked)["E_4"][0])
+
+
+def test_scale_table_columns():
+    fmtdef = pd.DataFrame(
+        {
+            "NAME": ["A", "B", "C"],
+            "SCALING_FACTOR": [2, np.nan, 0],
+            "OFFSET": [np.nan, 0.5, 1],
+        }
+    )
+    table = pd.DataFrame({"A": [1, 2], "B": [1.0, 2.0], "C": [3, 4]})
+    table = scale_table_columns(table, fmtdef)
+    assert list(table["A"]) == [2, 4]
+    assert list(table["B"]) == [1.5, 2.5]
+    assert list(table["C"]) == [4, 5]
+
+
 def test_simple_dsv_table(dsv_table_product, tracker_factory):
     prod_name, fpath, lpath = dsv_table_product
     data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
@@ -35,3 +257,301 @@ def test_simple_dsv_table(dsv_table_product, tracker_factory):
     assert np.isclose(data.SPREADSHEET.loc[0, 'X_0'], 5.5)
     assert data.SPREADSHEET.loc[5, 'Y'] == 'cat'
     assert data.SPREADSHEET.loc[9, "X_1"] == -12
+
+
+def test_dsv_stream_table(dsv_stream_product, tracker_factory):
+    prod_name, fpath, lpath = dsv_stream_product
+    data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+    assert list(data.SPREADSHEET.columns) == ['X', 'Y']
+    assert len(data.SPREADSHEET) == 10
+    assert data.SPREADSHEET.loc[9, 'X'] == 9
+    assert np.isclose(data.SPREADSHEET.loc[2, 'Y'], 0.5)
+
+
+def test_simple_fwf_table(fwf_table_product, tracker_factory):
+    prod_name, fpath, lpath = fwf_table_product
+    data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+    assert list(data.TABLE.columns) == ['X', 'Y', 'Z']
+    assert data.TABLE['X'].dtype == np.dtype('int64')
+    assert data.TABLE['Z'].dtype == np.dtype('float64')
+    assert data.TABLE.loc[3, 'Y'] == 'dog'
+    assert np.isclose(data.TABLE.loc[9, 'Z'], 11.25)
+
+
+def test_table_column_projection(
+    binary_table_product, dsv_table_product, fwf_table_product, tracker_factory
+):
+    for product, name, columns in (
+        (binary_table_product, "TABLE", ["X_1", "Y"]),
+        (dsv_table_product, "SPREADSHEET", ["Y"]),
+        (fwf_table_product, "TABLE", ["Z", "X"]),
+    ):
+        fpath = product[1]
+        full = pdr.read(fpath)[name]
+        data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+        data.load(name, columns=columns)
+        assert list(data[name].columns) == columns
+        assert data[name].equals(full[columns])
+    with pytest.raises(KeyError):
+        table_module._projected_fields(["X_0", "Y"], ["Q"])
+
+
+def test_table_row_selection(
+    binary_table_product,
+    dsv_table_product,
+    dsv_stream_product,
+    fwf_table_product,
+    tracker_factory
+):
+    for product, name, rows in (
+        (binary_table_product, "TABLE", slice(2, 5)),
+        (dsv_table_product, "SPREADSHEET", slice(-3, None)),
+        (dsv_stream_product, "SPREADSHEET", slice(1, 4)),
+        (fwf_table_product, "TABLE", slice(3, None, 2)),
+    ):
+        fpath = product[1]
+        full = pdr.read(fpath)[name]
+        data = pdr.read(fpath, debug=True, tracker=tracker_factory(fpath))
+        data.load(name, rows=rows)
+        assert data[name].equals(full.iloc[rows])
+
+
+def test_pds4_binary_table(pds4_binary_table_product):
+    from pdr.pds4_tools.reader import read_tables
+
+    prod_name, fpath, lpath = pds4_binary_table_product
+    table = pdr.read(lpath).TABLE
+    assert list(table.columns) == [
+        "TIME", "FLAG", "COUNTS_0", "COUNTS_1", "COUNTS_2"
+    ]
+    assert np.allclose(table["TIME"], np.arange(5) * 1.5)
+    assert list(table["FLAG"]) == ["OK", "NO", "OK", "NO", "OK"]
+    assert (
+        table[["COUNTS_0", "COUNTS_1", "COUNTS_2"]].to_numpy()
+        == np.arange(15).reshape(5, 3) - 7
+    ).all()
+    # vectorized extraction matches per-element slicing, including
+    # repetitions of nested groups
+    table_bytes = bytes(range(4 * 24))
+    records = read_tables._fixed_width_records(table_bytes, 4, 24)
+    for args in (
+        (2, 1, [4]),
+        (2, 1, [4, 3, 2], [2, 3], [6, 2]),
+    ):
+        expected = []
+        read_tables._extract_fixed_width_field_data(
+            expected, table_bytes, *args[:2], 24, *args[2:]
+        )
+        extracted = read_tables._extract_fixed_width_field_array(
+            records, *args
+        )
+        assert [bytes(e) for e in extracted] == expected
+    assert read_tables._fixed_width_records(table_bytes[:-1], 4, 24) is None
+
+
+def test_pds4_lazy_table(
+    pds4_binary_table_product, pds4_delimited_table_product, monkeypatch
+):
+    from pdr.pds4_tools.reader import read_tables
+
+    reads, read_byte_data = [], read_tables._read_table_byte_data
+
+    def spy_read(structure):
+        reads.append(structure)
+        return read_byte_data(structure)
+
+    monkeypatch.setattr(read_tables, "_read_table_byte_data", spy_read)
+    for product in (pds4_binary_table_product, pds4_delimited_table_product):
+        lpath = product[2]
+        full = pdr.read(lpath).TABLE
+        data = pdr.read(lpath)
+        data.load("TABLE", lazy_table=True)
+        table = data.TABLE
+        assert isinstance(table, LazyTable)
+        assert table.columns == list(full.columns)
+        assert table.shape == full.shape
+        requested, read_fields = [], table.read_fields
+
+        def spy(fields):
+            requested.append(fields)
+            return read_fields(fields)
+
+        table.read_fields = spy
+        # reading one column of a group field reads only that field
+        assert table["COUNTS_1"].equals(full["COUNTS_1"])
+        assert requested == [["GROUP_0, COUNTS"]]
+        assert table["COUNTS_0"].equals(full["COUNTS_0"])
+        assert len(requested) == 1
+        assert table.to_dataframe().equals(full)
+        assert "GROUP_0, COUNTS" not in requested[1]
+        # the table's bytes are read once, not once per column access
+        reads.clear()
+        data.load("TABLE", lazy_table=True, reload=True)
+        for column in data.TABLE.columns:
+            data.TABLE[column]
+        assert len(reads) == 1
+
+
+def test_pds4_lazy_table_column_order(pds4_repeated_field_table_product):
+    lpath = pds4_repeated_field_table_product[2]
+    full = pdr.read(lpath).TABLE
+    data = pdr.read(lpath)
+    data.load("TABLE", lazy_table=True)
+    table = data.TABLE
+    # Uniformly_Sampled fields come first, and both groups' COUNTS
+    # columns are kept, as in the eagerly-loaded table
+    assert table.columns == list(full.columns) == [
+        "STEP", "TIME", *[f"COUNTS_{i}" for i in range(3)] * 2
+    ]
+    assert table.shape == full.shape
+    pd.testing.assert_frame_equal(table["COUNTS_1"], full["COUNTS_1"])
+    assert table["TIME"].equals(full["TIME"])
+    pd.testing.assert_frame_equal(table.to_dataframe(), full)
+
+
+def test_pds4_table_manifest_cache(pds4_binary_table_product, tmp_path):
+    from pdr.pds4_tools.reader import table_objects
+    from pdr.tests.conftest import make_product
+    from pdr.tests.objects import STUB_PDS4_BINARY_TABLE_LABEL
+
+    prod_name, fpath, lpath = pds4_binary_table_product
+    table_objects._manifest_cache.clear()
+    table_objects._record_meta_cache.clear()
+    table = pdr.read(lpath).TABLE
+    assert len(table_objects._manifest_cache) == 1
+    # same structure, different number of records: cached manifest is
+    # reused with its field shapes rebound
+    records = np.frombuffer(fpath.read_bytes() * 2, dtype=np.uint8)
+    _, _, other = make_product(
+        tmp_path,
+        "PDS4-BINARY-TABLE-PROD-2",
+        records,
+        STUB_PDS4_BINARY_TABLE_LABEL,
+        label_suffix=".xml",
+        records=10
+    )
+    data = pdr.read(other)
+    assert len(table_objects._manifest_cache) == 1
+    assert len(data.TABLE) == 10
+    assert data.TABLE.iloc[5:].reset_index(drop=True).equals(table)
+    assert len(table_objects._record_meta_cache) == 1
+
+
+def test_pds4_delimited_table(pds4_delimited_table_product, monkeypatch):
+    from pdr.pds4_tools.reader import read_tables
+
+    prod_name, fpath, lpath = pds4_delimited_table_product
+    table = pdr.read(lpath).TABLE
+    assert list(table.columns) == [
+        "INDEX", "NAME", "VALUE", "COUNTS_0", "COUNTS_1"
+    ]
+    assert list(table["INDEX"]) == list(range(40))
+    assert table.loc[3, "NAME"] == "a,3"
+    assert table.loc[4, "NAME"] == "b4"
+    assert np.isclose(table.loc[5, "VALUE"], 1.25)
+    assert (table["COUNTS_1"] == -table["INDEX"]).all()
+    monkeypatch.setattr(read_tables, "DELIMITED_CHUNK_BYTES", 64)
+    data = fpath.read_bytes()
+    chunks = read_tables._split_delimited_chunks(data, b"\r\n", 40, 64)
+    assert len(chunks) > 1
+    assert sum(n for _, _, n in chunks) == 40
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+    assert all(data[:stop].endswith(b"\r\n") for _, stop, _ in chunks)
+
+    def no_pool(*_, **__):
+        raise AssertionError("serial parse used a process pool")
+
+    # parsing is serial unless worker processes are requested
+    with monkeypatch.context() as m:
+        m.setattr(read_tables, "ProcessPoolExecutor", no_pool)
+        serial = pdr.read(lpath).TABLE
+        lazy = pdr.read(lpath)
+        lazy.load("TABLE", lazy_table=True)
+        assert list(lazy.TABLE["INDEX"]) == list(range(40))
+    pd.testing.assert_frame_equal(serial, table)
+    # small chunks are parsed in worker processes and concatenated
+    parallel = pdr.read(lpath, delimited_workers=2).TABLE
+    pd.testing.assert_frame_equal(parallel, table)
+    data = pdr.read(lpath)
+    data.load("TABLE", delimited_workers=2)
+    pd.testing.assert_frame_equal(data.TABLE, table)
+
+
+def test_read_fixed_width_records():
+    text = "".join(
+        f"{i:3d} {'' if i % 2 else 'x' + str(i):>4} {i / 2:5.1f}"
+        f" {'N/A' if i == 3 else str(i):>3}\r\n"
+        for i in range(8)
+    )
+    colspecs = [(0, 3), (4, 8), (9, 14), (15, 18), (25, 25)]
+    expected = pd.read_fwf(
+        StringIO(text),
+        header=None,
+        colspecs=colspecs,
+        delimiter=PAD_CHARACTERS
+    )
+    for buffer in (text.encode(), text[:-2].encode()):
+        table = read_fixed_width_records(buffer, colspecs)
+        pd.testing.assert_frame_equal(table, expected)
+    # irregular record lengths are left to the fallback parser
+    assert read_fixed_width_records(b"1 2\r\n12 3\r\n", colspecs) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # boolean strings
+        "TRUE  1\r\nFalse 2\r\ntrue  3\r\n",
+        # boolean strings and nulls
+        "TRUE  1\r\nN/A   2\r\nfalse 3\r\n",
+        # boolean strings mixed with text and numbers
+        "TRUE  1\r\ncat   2\r\n1.5   3\r\n",
+        # blank records, including a trailing one
+        "cat   1\r\n       \r\n\t, \"   \r\ndog   2\r\n       \r\n",
+    ],
+)
+def test_read_fixed_width_records_matches_read_fwf(text):
+    colspecs = [(0, 5), (6, 7)]
+    expected = pd.read_fwf(
+        StringIO(text),
+        header=None,
+        colspecs=colspecs,
+        delimiter=PAD_CHARACTERS
+    )
+    table = read_fixed_width_records(text.encode(), colspecs)
+    pd.testing.assert_frame_equal(table, expected)
+    assert [type(v) for v in table[0]] == [type(v) for v in expected[0]]
+
+
+def test_ascii_parser_cache(
+    dsv_table_product, fwf_table_product, tmp_path, monkeypatch
+):
+    table_module.ASCII_PARSER_CACHE.clear()
+    # fixed-width parses are never cached
+    pdr.read(fwf_table_product[1]).load("TABLE")
+    assert table_module.ASCII_PARSER_CACHE == {}
+    prod_name, fpath, lpath = dsv_table_product
+    data = pdr.read(fpath)
+    data.load("SPREADSHEET")
+    assert list(table_module.ASCII_PARSER_CACHE.values()) == ["delimited"]
+    cache_path = tmp_path / "parsers.json"
+    table_module.save_ascii_parser_cache(cache_path)
+    table_module.ASCII_PARSER_CACHE.clear()
+    table_module.load_ascii_parser_cache(cache_path)
+    assert list(table_module.ASCII_PARSER_CACHE.values()) == ["delimited"]
+    cached = pdr.read(fpath).SPREADSHEET
+    pd.testing.assert_frame_equal(cached, data.SPREADSHEET)
+
+    # unexpected errors from the cached parser are not swallowed
+    def broken(*_, **__):
+        raise ValueError("not a parsing problem")
+
+    strategies = dict(table_module.ASCII_TABLE_STRATEGIES)
+    strategies["delimited"] = (broken, strategies["delimited"][1])
+    monkeypatch.setattr(
+        table_module, "ASCII_TABLE_STRATEGIES", MappingProxyType(strategies)
+    )
+    with pytest.warns(UserWarning, match="not a parsing problem"):
+        pdr.read(fpath).load("SPREADSHEET")
+    # and don't evict the cache entry
+    assert list(table_module.ASCII_PARSER_CACHE.values()) == ["delimited"]